@@ -1,9 +1,15 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
 from wordsearch.config.design import PREMIUM_NEUTRAL_THEME
 from wordsearch.domain.generated_puzzle import GeneratedPuzzle
 from wordsearch.domain.grid import PlacedWord
 from wordsearch.domain.page_plan import build_page_plan
 from wordsearch.domain.puzzle import PuzzleSpec
 from wordsearch.generation import book_assembly
+from wordsearch.rendering.batch import render_executor, resolve_renders, submit_render
 
 
 def make_generated(
@@ -193,3 +199,68 @@ def test_render_thematic_book_images_orchestrates_pages_in_order(monkeypatch, tm
 
     solution_calls = [call for call in calls if call[0] == "solution"]
     assert [call[-1] for call in solution_calls] == ["premium-neutral"] * 3
+
+
+def test_render_thematic_book_images_ticks_pooled_pairs_as_they_resolve(monkeypatch, tmp_path):
+    generated = [make_generated(index, f"Puzzle {index + 1}") for index in range(3)]
+    ticks = []
+    tick_events = [threading.Event() for _ in generated]
+    saw_previous_tick = []
+
+    @contextmanager
+    def fake_render_executor(workers):
+        assert workers == 2
+        with ThreadPoolExecutor(max_workers=len(generated) * 2) as executor:
+            yield executor
+
+    def fake_render_page(grid, words, idx, *, filename, **kwargs):
+        # Each puzzle after the first only finishes once the previous pair has ticked,
+        # which never happens if every render is awaited before the first tick.
+        if idx > 1:
+            saw_previous_tick.append(tick_events[idx - 2].wait(timeout=1))
+        return filename
+
+    def on_tick():
+        tick_events[len(ticks)].set()
+        ticks.append(len(ticks))
+
+    monkeypatch.setattr(book_assembly, "render_executor", fake_render_executor)
+    monkeypatch.setattr(book_assembly, "render_title_page", lambda book_title, *, filename, **kwargs: filename)
+    monkeypatch.setattr(book_assembly, "render_table_of_contents", lambda entries, *, output_dir, **kwargs: [])
+    monkeypatch.setattr(
+        book_assembly,
+        "render_instructions_page",
+        lambda book_title, *, filename, **kwargs: filename,
+    )
+    monkeypatch.setattr(book_assembly, "render_page", fake_render_page)
+    monkeypatch.setattr(
+        book_assembly,
+        "render_solution_page",
+        lambda grid, words, idx, *, filename, **kwargs: filename,
+    )
+
+    rendered = book_assembly.render_thematic_book_images(
+        book_title="Thematic Book",
+        generated_puzzles=generated,
+        page_plan=build_page_plan(generated),
+        output_dir=str(tmp_path),
+        progress_callback=on_tick,
+        workers=2,
+    )
+
+    assert ticks == [0, 1, 2]
+    assert saw_previous_tick == [True, True]
+    assert rendered.content_imgs[-3:] == [str(tmp_path / f"puzzle_{index}.png") for index in range(1, 4)]
+    assert rendered.solution_imgs == [str(tmp_path / f"puzzle_{index}_sol.png") for index in range(1, 4)]
+
+
+def test_render_executor_keeps_submission_order_inline_and_in_a_pool():
+    paths = [f"/tmp/out/puzzle_{index}.png" for index in range(5)]
+
+    with render_executor(1) as executor:
+        assert executor is None
+        inline = [submit_render(executor, os.path.basename, path) for path in paths]
+    with render_executor(2) as executor:
+        pooled = resolve_renders([submit_render(executor, os.path.basename, path) for path in paths])
+
+    assert inline == pooled == [f"puzzle_{index}.png" for index in range(5)]
@@ -2,17 +2,22 @@ from pathlib import Path
 
 from PIL import Image, ImageDraw
 
-from wordsearch.config.design import DEFAULT_THEME, KIDS_THEME, PREMIUM_NEUTRAL_THEME
+from wordsearch.config.design import DEFAULT_LAYOUT, DEFAULT_THEME, KIDS_THEME, PREMIUM_NEUTRAL_THEME
 from wordsearch.config.fonts import FONT_PATH, FONT_PATH_BOLD
 from wordsearch.config.layout import PAGE_H_PX, PAGE_W_PX
 from wordsearch.rendering import front_matter
 from wordsearch.rendering.common import load_font
 from wordsearch.rendering.front_matter import (
+    INSTRUCTIONS_HEADER,
+    TOC_HEADER,
     _draw_main_panel,
     _make_background,
     _measure_instruction_block_height,
+    _new_page,
+    _page_template,
     render_instructions_page,
     render_table_of_contents,
+    shared_page_template,
 )
 
 
@@ -55,6 +60,36 @@ def test_draw_main_panel_returns_expected_bounds_and_changes_canvas():
     assert image.tobytes() != before.tobytes()
 
 
+def test_new_page_copies_shared_template_without_mutating_it():
+    with shared_page_template():
+        first, first_draw, bounds, content_top = _new_page(None, 1, header=TOC_HEADER, theme=KIDS_THEME)
+        template, template_bounds = _page_template(None, 1, KIDS_THEME, DEFAULT_LAYOUT)
+        snapshot = template.tobytes()
+
+        first_draw.rectangle((0, 0, 50, 50), fill=(1, 2, 3, 255))
+        second, _second_draw, _bounds, second_top = _new_page(None, 1, header=INSTRUCTIONS_HEADER, theme=KIDS_THEME)
+
+        assert _page_template(None, 1, KIDS_THEME, DEFAULT_LAYOUT)[0] is template
+
+    assert bounds == template_bounds
+    assert content_top > bounds[1] and second_top > bounds[1]
+    assert first is not template and second is not template
+    assert template.tobytes() == snapshot
+    assert second.getpixel((10, 10))[:3] != (1, 2, 3)
+    assert template.mode == "RGB"
+
+
+def test_page_template_is_not_kept_outside_shared_scope():
+    with shared_page_template():
+        scoped = _page_template(None, 1, KIDS_THEME, DEFAULT_LAYOUT)[0]
+
+    assert front_matter._template_scope is None
+    assert _page_template(None, 1, KIDS_THEME, DEFAULT_LAYOUT)[0] is not scoped
+    assert _page_template(None, 1, KIDS_THEME, DEFAULT_LAYOUT)[0] is not _page_template(
+        None, 1, KIDS_THEME, DEFAULT_LAYOUT
+    )[0]
+
+
 def test_measure_instruction_block_height_increases_with_wrapped_content():
     image = Image.new("RGBA", (PAGE_W_PX, PAGE_H_PX), DEFAULT_THEME.page_background_fill)
     draw = ImageDraw.Draw(image)
@@ -148,3 +148,17 @@ def test_easy_generation_uses_only_easy_directions():
         (placed.d_row, placed.d_col)
         for placed in result.placed_words
     }.issubset({(0, 1), (1, 0)})
+
+
+def test_find_placement_skips_off_board_and_conflicting_candidates():
+    grid = [["", "", ""], ["", "X", ""], ["", "", ""]]
+    candidates = [
+        (0, 1, 0, 1),  # runs off the right edge
+        (0, 1, 1, 0),  # crosses the centre X
+        (0, 0, 1, 1),  # crosses the centre X
+        (2, 0, 0, 1),
+    ]
+
+    assert gg._find_placement(grid, "CAT", candidates) == (2, 0, 0, 1)
+    assert gg._find_placement(grid, "AXE", candidates) == (0, 1, 1, 0)
+    assert gg._find_placement(grid, "LONG", candidates) is None
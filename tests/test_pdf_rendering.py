@@ -2,6 +2,7 @@ from pathlib import Path
 
 from PIL import Image
 from pypdf import PdfReader
+from reportlab import rl_config
 
 from wordsearch.config.layout import PAGE_H_PX, PAGE_W_PX
 from wordsearch.rendering.pdf import generate_pdf
@@ -80,3 +81,44 @@ def test_generate_pdf_writes_basic_metadata(tmp_path):
     assert metadata["/Subject"] == "Puzzle Book"
     assert metadata["/Keywords"] == "word search, KDP"
     assert metadata["/Creator"] == "sopa-libros"
+
+
+def test_generate_pdf_embeds_jpeg_pages_when_quality_is_given(tmp_path):
+    puzzle_img = create_sample_png(tmp_path / "puzzle.png", (255, 255, 255))
+    solution_img = create_sample_png(tmp_path / "solution.png", (240, 240, 240))
+    pdf_path = tmp_path / "jpeg_book.pdf"
+
+    generate_pdf([puzzle_img], [solution_img], outname=str(pdf_path), jpeg_quality=88)
+
+    assert_valid_pdf(pdf_path)
+    assert b"/DCTDecode" in pdf_path.read_bytes()
+    assert len(PdfReader(str(pdf_path)).pages) == 3
+
+
+def test_generate_pdf_numbers_every_page_in_black_helvetica_10(tmp_path):
+    puzzle_imgs = [create_sample_png(tmp_path / f"puzzle_{i}.png", (255, 255, 255)) for i in range(2)]
+    solution_img = create_sample_png(tmp_path / "solution.png", (240, 240, 240))
+    pdf_path = tmp_path / "numbered_book.pdf"
+
+    generate_pdf(puzzle_imgs, [solution_img], outname=str(pdf_path))
+
+    pages = PdfReader(str(pdf_path)).pages
+    assert [page.extract_text().split()[-1] for page in pages] == ["1", "2", "3", "4"]
+    assert "SOLUTIONS" in pages[2].extract_text()
+    for page in pages:
+        content = page.get_contents().get_data()
+        assert b" 10 Tf" in content
+        assert b" rg" not in content
+
+
+def test_generate_pdf_compresses_page_streams_without_touching_reportlab_config(tmp_path):
+    puzzle_img = create_sample_png(tmp_path / "puzzle.png", (255, 255, 255))
+    solution_img = create_sample_png(tmp_path / "solution.png", (240, 240, 240))
+    pdf_path = tmp_path / "compressed_book.pdf"
+    use_a85 = rl_config.useA85
+
+    generate_pdf([puzzle_img], [solution_img], outname=str(pdf_path))
+
+    assert rl_config.useA85 == use_a85
+    for page in PdfReader(str(pdf_path)).pages:
+        assert "/FlateDecode" in page["/Contents"].get_object()["/Filter"]
@@ -115,3 +115,22 @@ def test_parse_puzzle_missing_required_title_raises_error(tmp_path):
 
     with pytest.raises(PuzzleParseError, match="falta 'title:'"):
         parse_puzzle_file(path)
+
+
+def test_parse_block_missing_closing_tag_raises_error(tmp_path):
+    path = write_tmp_file(
+        tmp_path,
+        """
+        [Block]
+        name: Unclosed
+        [Puzzle]
+        title: Swallowed
+        fact: Part of the open block.
+        words:
+        Justice
+        [/Puzzle]
+        """,
+    )
+
+    with pytest.raises(PuzzleParseError, match=r"Falta '\[/Block\]'"):
+        parse_puzzle_file(path)
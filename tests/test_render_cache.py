@@ -0,0 +1,75 @@
+import os
+import time
+from pathlib import Path
+
+from wordsearch.rendering.render_cache import prune_render_cache, render_cache_key, render_cached
+
+RENDER_CALLS = []
+
+
+def fake_render(grid, words, idx, *, filename, puzzle_title=None):
+    RENDER_CALLS.append((idx, filename, puzzle_title))
+    Path(filename).write_bytes(f"{grid}|{words}|{idx}|{puzzle_title}".encode())
+    return filename
+
+
+def test_render_cached_reuses_identical_pages_and_rerenders_changes(tmp_path):
+    RENDER_CALLS.clear()
+    cache_dir = str(tmp_path / "cache")
+    grid = [["C", "A", "T"]]
+
+    first = render_cached(fake_render, grid, ["CAT"], 1, cache_dir=cache_dir, filename=str(tmp_path / "a.png"))
+    second = render_cached(fake_render, grid, ["CAT"], 1, cache_dir=cache_dir, filename=str(tmp_path / "b.png"))
+    changed = render_cached(
+        fake_render,
+        grid,
+        ["CAT"],
+        1,
+        cache_dir=cache_dir,
+        filename=str(tmp_path / "c.png"),
+        puzzle_title="New title",
+    )
+
+    assert [call[1] for call in RENDER_CALLS] == [first, changed]
+    assert Path(second).read_bytes() == Path(first).read_bytes()
+    assert Path(changed).read_bytes() != Path(first).read_bytes()
+    assert len(list(Path(cache_dir).rglob("*.png"))) == 2
+
+
+def test_render_cache_key_ignores_output_filename_only():
+    base = render_cache_key(fake_render, ([["A"]], ["A"], 1), {"filename": "one.png"})
+
+    assert render_cache_key(fake_render, ([["A"]], ["A"], 1), {"filename": "two.png"}) == base
+    assert render_cache_key(fake_render, ([["B"]], ["A"], 1), {"filename": "one.png"}) != base
+
+
+def test_prune_render_cache_drops_stale_generations_and_unused_pages(tmp_path):
+    cache_dir = tmp_path / "cache"
+    render_cached(fake_render, [["A"]], ["A"], 1, cache_dir=str(cache_dir), filename=str(tmp_path / "fresh.png"))
+    render_cached(fake_render, [["B"]], ["B"], 2, cache_dir=str(cache_dir), filename=str(tmp_path / "old.png"))
+    (fresh_entry,) = [path for path in cache_dir.rglob("*.png") if path.read_bytes().endswith(b"|1|None")]
+    (old_entry,) = [path for path in cache_dir.rglob("*.png") if path.read_bytes().endswith(b"|2|None")]
+    long_ago = time.time() - 60 * 86400
+    os.utime(old_entry, (long_ago, long_ago))
+    (fresh_entry.parent / "leftover.123.tmp").write_bytes(b"partial")
+    (cache_dir / "v0-previous").mkdir()
+    (cache_dir / "v0-previous" / "page.png").write_bytes(b"png")
+    (cache_dir / "legacy.png").write_bytes(b"png")
+
+    assert prune_render_cache(str(cache_dir)) == 4
+    assert sorted(cache_dir.rglob("*")) == [fresh_entry.parent, fresh_entry]
+    assert prune_render_cache(str(cache_dir)) == 0
+    assert prune_render_cache(str(tmp_path / "missing")) == 0
+
+
+def test_render_cached_hit_refreshes_entry_age(tmp_path):
+    cache_dir = tmp_path / "cache"
+    render_cached(fake_render, [["A"]], ["A"], 1, cache_dir=str(cache_dir), filename=str(tmp_path / "a.png"))
+    (entry,) = cache_dir.rglob("*.png")
+    long_ago = time.time() - 60 * 86400
+    os.utime(entry, (long_ago, long_ago))
+
+    render_cached(fake_render, [["A"]], ["A"], 1, cache_dir=str(cache_dir), filename=str(tmp_path / "b.png"))
+
+    assert prune_render_cache(str(cache_dir)) == 0
+    assert entry.exists()
@@ -0,0 +1,68 @@
+from PIL import Image, ImageDraw
+
+from wordsearch.config.design import DEFAULT_LAYOUT
+from wordsearch.config.fonts import FONT_PATH
+from wordsearch.config.formats import get_format_preset
+from wordsearch.rendering.common import _text_bbox, format_visual_scale, load_font, save_page, text_size, wrap_text
+
+
+def test_load_font_reuses_instances_per_path_and_size():
+    load_font.cache_clear()
+
+    first = load_font(FONT_PATH, 30)
+    second = load_font(FONT_PATH, 30)
+    other_size = load_font(FONT_PATH, 31)
+
+    assert first is second
+    assert load_font.cache_info().hits == 1
+    assert load_font.cache_info().misses == 2
+    assert other_size is not None
+
+
+def test_text_size_matches_textbbox_and_memoises_measurements():
+    font = load_font(FONT_PATH, 28)
+    draw = ImageDraw.Draw(Image.new("RGB", (10, 10)))
+    bbox = draw.textbbox((0, 0), "GIRASOL", font=font)
+    _text_bbox.cache_clear()
+
+    assert text_size(draw, "GIRASOL", font) == (bbox[2] - bbox[0], bbox[3] - bbox[1])
+    text_size(draw, "GIRASOL", font)
+
+    assert _text_bbox.cache_info().hits == 1
+
+
+def test_save_page_keeps_pixels_and_dpi_with_fast_png_compression(tmp_path):
+    page = Image.new("RGBA", (60, 80), (12, 34, 56, 255))
+    output = tmp_path / "page.png"
+
+    save_page(page, str(output), output_width_px=60, output_height_px=80, dpi=300)
+
+    with Image.open(output) as saved:
+        assert saved.format == "PNG"
+        assert saved.mode == "RGB"
+        assert round(saved.info["dpi"][0]) == 300
+        assert saved.getpixel((30, 40)) == (12, 34, 56)
+
+
+def test_wrap_text_fills_lines_up_to_max_width():
+    font = load_font(FONT_PATH, 24)
+    draw = ImageDraw.Draw(Image.new("RGB", (10, 10)))
+    text = "the quick brown fox jumps over the lazy dog " * 3 + "supercalifragilisticexpialidocious"
+    max_width = int(font.getlength("the quick brown fox"))
+
+    lines = wrap_text(draw, text, font, max_width)
+
+    assert " ".join(lines) == " ".join(text.split())
+    assert lines[0] == "the quick brown fox"
+    assert lines[-1] == "supercalifragilisticexpialidocious"
+    for line, next_line in zip(lines, lines[1:]):
+        assert font.getlength(line) <= max_width
+        assert font.getlength(f"{line} {next_line.split()[0]}") > max_width
+
+
+def test_format_visual_scale_grows_with_trim_up_to_the_cap():
+    large = get_format_preset("activity-8.5x11").to_layout_config()
+
+    assert format_visual_scale(DEFAULT_LAYOUT) == 1.0
+    assert format_visual_scale(large) == 1.15
+    assert format_visual_scale(large, max_scale=1.16) == 1.16
@@ -1,10 +1,17 @@
 from pathlib import Path
 
-from PIL import Image
+from PIL import Image, ImageChops, ImageDraw
 
+from wordsearch.config.fonts import FONT_PATH
 from wordsearch.config.layout import PAGE_H_PX, PAGE_W_PX
 from wordsearch.domain.grid import PlacedWord
+from wordsearch.rendering import front_matter
+from wordsearch.rendering.backgrounds import _load_scaled_background, load_page_background
 from wordsearch.rendering.block_cover import render_block_cover
+from wordsearch.rendering.common import load_font
+from wordsearch.rendering.grid import _grid_lattice_mask, _paste_letter
+from wordsearch.rendering.highlights import _in_bounds_length, build_solution_highlight_layer
+from wordsearch.rendering.page_frame import _framed_page_template, create_framed_page, create_page_canvas
 from wordsearch.rendering.puzzle_page import render_page
 from wordsearch.rendering.solution_page import render_solution_page
 
@@ -80,3 +87,188 @@ def test_render_block_cover_creates_valid_png(tmp_path):
 
     assert returned_path == str(output_path)
     assert_valid_non_blank_png(output_path)
+
+
+def test_load_page_background_reuses_scaled_image_and_returns_copies(tmp_path):
+    background_path = tmp_path / "background.png"
+    Image.new("RGBA", (40, 60), (10, 20, 30, 255)).save(background_path)
+    _load_scaled_background.cache_clear()
+
+    first = load_page_background(str(background_path), (20, 30), 0.5, cached=True)
+    first.putpixel((0, 0), (255, 255, 255, 255))
+    second = load_page_background(str(background_path), (20, 30), 0.5, cached=True)
+    uncached = load_page_background(str(background_path), (20, 30), 0.5)
+
+    assert _load_scaled_background.cache_info().hits == 1
+    assert _load_scaled_background.cache_info().currsize == 1
+    assert uncached.tobytes() == second.tobytes()
+    assert second.size == (20, 30)
+    assert second.getpixel((0, 0)) == (10, 20, 30, 127)
+    assert load_page_background(str(tmp_path / "missing.png"), (20, 30), 0.5) is None
+
+
+def test_supersampled_pages_skip_background_cache(tmp_path):
+    background_path = tmp_path / "background.png"
+    Image.new("RGBA", (40, 60), (10, 20, 30, 255)).save(background_path)
+    _load_scaled_background.cache_clear()
+
+    canvas = create_page_canvas(str(background_path), 3, mode="RGB")
+
+    assert canvas.size == (PAGE_W_PX * 3, PAGE_H_PX * 3)
+    assert _load_scaled_background.cache_info().currsize == 0
+
+    front_matter._make_background(str(background_path), 3, mode="RGB")
+
+    assert _load_scaled_background.cache_info().currsize == 0
+
+    create_page_canvas(str(background_path), 1)
+
+    assert _load_scaled_background.cache_info().currsize == 1
+
+
+def test_paste_letter_matches_centered_draw_text():
+    font = load_font(FONT_PATH, 32)
+    expected = Image.new("RGBA", (140, 60), (240, 240, 240, 255))
+    actual = expected.copy()
+
+    for index, letter in enumerate("QÑW"):
+        cell_left = 3 + index * 45
+        ImageDraw.Draw(expected).text(
+            (cell_left + 22.5, 7 + 22.5),
+            letter,
+            fill=(20, 30, 40, 255),
+            font=font,
+            anchor="mm",
+        )
+        _paste_letter(
+            img=actual,
+            letter=letter,
+            font=font,
+            cell_left=cell_left,
+            cell_top=7,
+            cell_size=45,
+            fill=(20, 30, 40, 255),
+        )
+
+    assert ImageChops.difference(expected, actual).getbbox() is None
+
+
+def test_solution_highlight_layer_only_covers_the_grid_area():
+    layer = build_solution_highlight_layer(
+        placed_words=[PlacedWord("CAT", 0, 0, 0, 1)],
+        rows=6,
+        cols=6,
+        grid_left_hi=300,
+        grid_top_hi=400,
+        cell_size_hi=50,
+        page_w_hi=2000,
+        page_h_hi=3000,
+        scale=1,
+        highlight_fill=(255, 200, 0, 120),
+        highlight_border=(200, 120, 0, 255),
+    )
+
+    assert layer.origin == (250, 350)
+    assert layer.overlay.size == (400, 400)
+    assert layer.positions == {(0, 0), (0, 1), (0, 2)}
+    assert layer.overlay.getbbox() is not None
+
+
+def test_supersampled_highlight_layer_is_downsampled_to_page_resolution():
+    kwargs = dict(
+        placed_words=[PlacedWord("CAT", 0, 0, 1, 1)],
+        rows=6,
+        cols=6,
+        grid_left_hi=300,
+        grid_top_hi=400,
+        cell_size_hi=50,
+        page_w_hi=2000,
+        page_h_hi=3000,
+        scale=1,
+        highlight_fill=(255, 200, 0, 120),
+        highlight_border=(200, 120, 0, 255),
+    )
+
+    plain = build_solution_highlight_layer(**kwargs)
+    smooth = build_solution_highlight_layer(**kwargs, supersample=2)
+
+    assert smooth.origin == plain.origin
+    assert smooth.overlay.size == plain.overlay.size
+    assert smooth.positions == plain.positions
+    assert ImageChops.difference(smooth.overlay, plain.overlay).getbbox() is not None
+
+    def soft_edge_pixels(layer):
+        histogram = layer.overlay.getchannel("A").histogram()
+        return sum(histogram[1:255]) - histogram[120]
+
+    def half_coverage_bbox(layer):
+        return layer.overlay.getchannel("A").point(lambda alpha: 255 if alpha >= 128 else 0).getbbox()
+
+    # The aliased ring only has opaque border and fill alpha; LANCZOS softens its edges.
+    assert soft_edge_pixels(plain) == 0
+    assert soft_edge_pixels(smooth) > 0
+    assert smooth.overlay.getchannel("A").getbbox() != plain.overlay.getchannel("A").getbbox()
+    # Softening must not shift the capsule: its half-coverage outline stays put.
+    assert half_coverage_bbox(smooth) == half_coverage_bbox(plain)
+
+
+def test_grid_lattice_mask_matches_individual_grid_lines():
+    expected = Image.new("L", (120, 100), 0)
+    draw = ImageDraw.Draw(expected)
+    for row in range(4):
+        draw.line((10, 10 + row * 25, 85, 10 + row * 25), fill=255, width=3)
+    for col in range(4):
+        draw.line((10 + col * 25, 10, 10 + col * 25, 85), fill=255, width=3)
+
+    mask, margin = _grid_lattice_mask(3, 3, 25, 3)
+    actual = Image.new("L", (120, 100), 0)
+    actual.paste(255, (10 - margin, 10 - margin), mask)
+
+    assert ImageChops.difference(expected, actual).getbbox() is None
+    assert _grid_lattice_mask(3, 3, 25, 3)[0] is mask
+
+
+def test_in_bounds_length_matches_walking_the_word():
+    for row in range(-1, 5):
+        for col in range(-1, 5):
+            for d_row in (-1, 0, 1):
+                for d_col in (-1, 0, 1):
+                    expected = 0
+                    while expected < 4 and 0 <= row + d_row * expected < 4 and 0 <= col + d_col * expected < 4:
+                        expected += 1
+                    assert _in_bounds_length(row, col, d_row, d_col, 4, 4, 4) == expected
+
+
+def test_create_page_canvas_can_start_in_rgb(tmp_path):
+    background_path = tmp_path / "background.png"
+    Image.new("RGBA", (30, 40), (90, 120, 150, 255)).save(background_path)
+
+    rgba = create_page_canvas(str(background_path), 1)
+    rgb = create_page_canvas(str(background_path), 1, mode="RGB")
+
+    assert rgba.mode == "RGBA"
+    assert rgb.mode == "RGB"
+    assert rgb.tobytes() == rgba.convert("RGB").tobytes()
+
+
+def test_puzzle_page_skips_the_highlight_layer(tmp_path, monkeypatch):
+    import wordsearch.rendering.grid as grid_module
+
+    def fail(**kwargs):
+        raise AssertionError("puzzle pages must not build a highlight overlay")
+
+    monkeypatch.setattr(grid_module, "build_solution_highlight_layer", fail)
+
+    render_page(sample_grid(), ["CAT", "DOG"], 1, filename=str(tmp_path / "puzzle.png"))
+
+
+def test_framed_page_is_built_once_and_copied_per_page():
+    _framed_page_template.cache_clear()
+    first, frame = create_framed_page(None, 1, mode="RGB")
+    first.paste((1, 2, 3), (0, 0, 20, 20))
+    second, second_frame = create_framed_page(None, 1, mode="RGB")
+
+    assert second_frame == frame
+    assert second.getpixel((5, 5)) != (1, 2, 3)
+    assert first.mode == second.mode == "RGB"
+    assert _framed_page_template.cache_info().hits == 1
@@ -49,10 +49,22 @@ def test_ask_total_puzzles_retries_until_positive_integer(monkeypatch):
     assert simple._ask_total_puzzles(source_type="manual", wordlist_count=1) == 6
 
 
+def test_ask_workers_defaults_to_inline_rendering(monkeypatch):
+    _mock_inputs(monkeypatch, [""])
+
+    assert simple._ask_workers() == 1
+
+
+def test_ask_workers_retries_until_positive_integer(monkeypatch):
+    _mock_inputs(monkeypatch, ["0", "many", "4"])
+
+    assert simple._ask_workers() == 4
+
+
 def test_main_builds_options_and_delegates_generation(monkeypatch):
     generated_options = []
 
-    _mock_inputs(monkeypatch, ["Animals", "3", "8"])
+    _mock_inputs(monkeypatch, ["Animals", "3", "8", ""])
     monkeypatch.setattr(simple, "ask_grid_size", lambda _settings: 15)
     monkeypatch.setattr(
         simple,
@@ -70,3 +82,4 @@ def test_main_builds_options_and_delegates_generation(monkeypatch):
     assert options.grid_size == 15
     assert options.wordlists == [["gato", "perro", "casa", "luna", "sol", "arbol", "cielo", "mar"]]
     assert options.total_puzzles == 8
+    assert options.workers == 1
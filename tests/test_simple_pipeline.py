@@ -1,3 +1,6 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+
 from wordsearch.domain.book import SimpleGenerationOptions
 from wordsearch.domain.grid import GridGenerationFailure, GridGenerationResult, PlacedWord
 from wordsearch.generation import simple_pipeline
@@ -187,3 +190,55 @@ def test_generate_simple_book_returns_none_when_pdf_is_locked(monkeypatch, tmp_p
     monkeypatch.setattr(simple_pipeline, "generate_pdf", fake_generate_pdf)
 
     assert simple_pipeline.generate_simple_book(make_options()) is None
+
+
+def test_generate_simple_book_tracks_pooled_renders_as_they_resolve(monkeypatch, tmp_path):
+    tracked = []
+
+    @contextmanager
+    def fake_render_executor(workers):
+        assert workers == 3
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield executor
+
+    def fake_track_progress(items, *, description, total=None):
+        items = list(items)
+        tracked.append((description, items))
+        yield from items
+
+    monkeypatch.setattr(simple_pipeline, "BASE_OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        simple_pipeline,
+        "validate_generation_assets",
+        lambda **kwargs: AssetValidationReport(),
+    )
+    monkeypatch.setattr(simple_pipeline, "validate_wordlists_for_grid", lambda *args, **kwargs: [])
+    monkeypatch.setattr(simple_pipeline._WORD_SHUFFLER, "shuffle", lambda words: None)
+    monkeypatch.setattr(
+        simple_pipeline,
+        "generate_word_search_grid",
+        lambda *args, **kwargs: GridGenerationResult(
+            grid=[["C", "A", "T"]],
+            placed_words=[PlacedWord("CAT", 0, 0, 0, 1)],
+            attempts_used=1,
+        ),
+    )
+    monkeypatch.setattr(simple_pipeline, "render_executor", fake_render_executor)
+    monkeypatch.setattr(simple_pipeline, "track_progress", fake_track_progress)
+    monkeypatch.setattr(simple_pipeline, "render_page", lambda *args, **kwargs: kwargs["filename"])
+    monkeypatch.setattr(
+        simple_pipeline,
+        "render_solution_page",
+        lambda *args, **kwargs: kwargs["filename"],
+    )
+    monkeypatch.setattr(simple_pipeline, "generate_pdf", lambda puzzles, solutions, *, outname: outname)
+
+    options = make_options()
+    options.workers = 3
+
+    assert simple_pipeline.generate_simple_book(options) is not None
+    assert len(tracked) == 1
+    description, items = tracked[0]
+    assert description == "Rendering puzzle and solution pages"
+    assert len(items) == options.total_puzzles
+    assert all(isinstance(page, Future) for pair in items for page in pair)
@@ -130,6 +130,28 @@ def test_resolve_options_rejects_non_positive_limit():
         thematic._resolve_options(make_args(limit=0))
 
 
+def test_resolve_options_accepts_workers():
+    assert thematic._resolve_options(make_args()).workers == 1
+    assert thematic._resolve_options(make_args(workers=4)).workers == 4
+
+
+def test_resolve_options_accepts_render_cache():
+    assert thematic._resolve_options(make_args()).render_cache is False
+    assert thematic._resolve_options(make_args(render_cache=True)).render_cache is True
+
+
+def test_resolve_options_accepts_pdf_jpeg_quality():
+    assert thematic._resolve_options(make_args()).pdf_jpeg_quality is None
+    assert thematic._resolve_options(make_args(pdf_jpeg_quality=88)).pdf_jpeg_quality == 88
+    with pytest.raises(ValueError, match="--pdf-jpeg-quality"):
+        thematic._resolve_options(make_args(pdf_jpeg_quality=0))
+
+
+def test_resolve_options_rejects_non_positive_workers():
+    with pytest.raises(ValueError, match="--workers"):
+        thematic._resolve_options(make_args(workers=0))
+
+
 def test_parse_args_accepts_clean_output(monkeypatch):
     monkeypatch.setattr(
         sys,
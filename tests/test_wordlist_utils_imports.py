@@ -42,3 +42,12 @@ def test_validate_wordlists_for_grid_reports_oversized_words_without_mutating_in
             "length": 7,
         }
     ]
+
+
+def test_validate_wordlists_for_grid_reports_only_words_too_long_after_cleaning():
+    wordlists = [["cat", " ice cream  ", ""], ["hippopotamus"]]
+
+    assert validate_wordlists_for_grid(wordlists, grid_size=8) == [
+        {"list_index": 1, "word": "hippopotamus", "clean_word": "hippopotamus", "length": 12},
+    ]
+    assert validate_wordlists_for_grid(wordlists, grid_size=7, remove_spaces=False)[0]["clean_word"] == "ice cream"
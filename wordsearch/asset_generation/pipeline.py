@@ -7,6 +7,7 @@ manifest with the same contract that a future AI provider will satisfy.
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -250,6 +251,4 @@ def _join_prompt_parts(parts: list[str]) -> str:
 
 
 def _json_dumps(payload: dict) -> str:
-    import json
-
     return json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True)
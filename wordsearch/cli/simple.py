@@ -46,6 +46,20 @@ def _ask_total_puzzles(source_type: str, wordlist_count: int) -> int:
             print("Introduce un numero entero positivo, por favor.")
 
 
+def _ask_workers() -> int:
+    while True:
+        workers_raw = input("\nProcesos de render en paralelo [por defecto 1]: ").strip()
+        if not workers_raw:
+            return 1
+        try:
+            workers = int(workers_raw)
+            if workers <= 0:
+                raise ValueError
+            return workers
+        except ValueError:
+            print("Introduce un numero entero positivo, por favor.")
+
+
 def main() -> None:
     print_app_header("Simple word search book generator")
 
@@ -59,11 +73,13 @@ def main() -> None:
     ]
     wordlists, source_type = prompt_wordlists(predefined_wordlists)
     total_puzzles = _ask_total_puzzles(source_type, len(wordlists))
+    workers = _ask_workers()
 
     print_info(f"Book title: {book_title}")
     print_info(f"Difficulty: {difficulty.value.upper()}")
     print_info(f"Grid size: {grid_size}")
     print_info(f"Total puzzles: {total_puzzles}")
+    print_info(f"Render workers: {workers}")
     print_info("Starting simple generation pipeline...")
 
     generate_simple_book(
@@ -73,6 +89,7 @@ def main() -> None:
             difficulty=difficulty,
             grid_size=grid_size,
             total_puzzles=total_puzzles,
+            workers=workers,
         )
     )
     print_success("Simple generation finished")
@@ -41,6 +41,17 @@ def _parse_args() -> argparse.Namespace:
             f"Defaults to --limit {PREVIEW_DEFAULT_LIMIT} and --seed {PREVIEW_DEFAULT_SEED} when omitted."
         ),
     )
+    parser.add_argument("--workers", type=int, default=1, help="Render puzzle and solution pages on N processes. Defaults to 1 (no pool).")
+    parser.add_argument(
+        "--render-cache",
+        action="store_true",
+        help="Reuse puzzle and solution PNGs from earlier runs when their content is unchanged.",
+    )
+    parser.add_argument(
+        "--pdf-jpeg-quality",
+        type=int,
+        help="Embed page images in the PDF as JPEG at this quality (1-95) instead of lossless PNG.",
+    )
     parser.add_argument("--validate-only", action="store_true", help="Parse and validate the thematic input/assets without generating grids, images or PDF.")
     parser.add_argument("--clean-output", action="store_true", help="Remove the generated output folder for this book before creating new files.")
     return parser.parse_args()
@@ -80,6 +91,12 @@ def _resolve_options(args: argparse.Namespace) -> ThematicGenerationOptions:
         raise ValueError("--clean-output no se puede combinar con --validate-only.")
     if args.limit is not None and args.limit <= 0:
         raise ValueError("--limit debe ser un entero positivo.")
+    workers = getattr(args, "workers", 1)
+    if workers <= 0:
+        raise ValueError("--workers debe ser un entero positivo.")
+    pdf_jpeg_quality = getattr(args, "pdf_jpeg_quality", None)
+    if pdf_jpeg_quality is not None and not 1 <= pdf_jpeg_quality <= 95:
+        raise ValueError("--pdf-jpeg-quality debe estar entre 1 y 95.")
 
     book_title = (args.title or "").strip()
     if not book_title:
@@ -127,6 +144,9 @@ def _resolve_options(args: argparse.Namespace) -> ThematicGenerationOptions:
         output_dir=(args.output_dir or "").strip() or None,
         limit=limit,
         preview=args.preview,
+        workers=workers,
+        render_cache=getattr(args, "render_cache", False),
+        pdf_jpeg_quality=pdf_jpeg_quality,
     )
 
 
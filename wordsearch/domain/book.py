@@ -27,6 +27,9 @@ class ThematicGenerationOptions:
     output_dir: str | None = None
     limit: int | None = None
     preview: bool = False
+    workers: int = 1
+    render_cache: bool = False
+    pdf_jpeg_quality: int | None = None
 
 
 @dataclass
@@ -38,3 +41,4 @@ class SimpleGenerationOptions:
     difficulty: DifficultyLevel
     grid_size: int
     total_puzzles: int
+    workers: int = 1
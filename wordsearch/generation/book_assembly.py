@@ -11,9 +11,15 @@ from wordsearch.config.design import DEFAULT_LAYOUT, DEFAULT_THEME, LayoutConfig
 from wordsearch.config.paths import build_output_file
 from wordsearch.domain.generated_puzzle import GeneratedPuzzle
 from wordsearch.domain.page_plan import PagePlan
+from wordsearch.rendering.batch import render_executor, resolve_renders, submit_render
 from wordsearch.rendering.block_cover import render_block_cover
-from wordsearch.rendering.front_matter import render_instructions_page, render_table_of_contents
+from wordsearch.rendering.front_matter import (
+    render_instructions_page,
+    render_table_of_contents,
+    shared_page_template,
+)
 from wordsearch.rendering.puzzle_page import render_page
+from wordsearch.rendering.render_cache import render_cached
 from wordsearch.rendering.solution_page import render_solution_page
 from wordsearch.rendering.title_page import render_title_page
 from wordsearch.utils.slug import slugify
@@ -58,6 +64,12 @@ def _block_cover_background(asset_manifest: AssetManifest | None, block_name: st
     return asset_manifest.cover_background_for_block(block_name, fallback=fallback) if asset_manifest else fallback
 
 
+def _submit_page(executor, render_cache_dir: str | None, render, *args, **kwargs):
+    if render_cache_dir is None:
+        return submit_render(executor, render, *args, **kwargs)
+    return submit_render(executor, render_cached, render, *args, cache_dir=render_cache_dir, **kwargs)
+
+
 def render_thematic_book_images(
     *,
     book_title: str,
@@ -68,8 +80,16 @@ def render_thematic_book_images(
     layout: LayoutConfig = DEFAULT_LAYOUT,
     asset_manifest: AssetManifest | None = None,
     progress_callback: Callable[[], None] | None = None,
+    workers: int = 1,
+    render_cache_dir: str | None = None,
 ) -> RenderedBookImages:
-    """Render all PNG page assets for the thematic book."""
+    """Render all PNG page assets for the thematic book.
+
+    With ``workers > 1`` puzzle and solution pages are rendered on a process
+    pool; front matter and block covers stay inline. Page order is unchanged.
+    With ``render_cache_dir`` unchanged puzzle and solution pages are copied
+    from earlier runs instead of being rendered again.
+    """
     rendered = RenderedBookImages()
     layout_kwargs = _layout_kwargs(layout)
     global_background = _global_background(asset_manifest)
@@ -85,87 +105,107 @@ def render_thematic_book_images(
         )
     )
 
-    rendered.content_imgs.extend(
-        render_table_of_contents(
-            build_toc_entries(page_plan),
-            output_dir=output_dir,
-            background_path=global_background,
-            theme=theme,
-            **layout_kwargs,
+    with shared_page_template():
+        rendered.content_imgs.extend(
+            render_table_of_contents(
+                build_toc_entries(page_plan),
+                output_dir=output_dir,
+                background_path=global_background,
+                theme=theme,
+                **layout_kwargs,
+            )
         )
-    )
 
-    instr_filename = build_output_file(output_dir, "02_instructions.png")
-    rendered.content_imgs.append(
-        render_instructions_page(
-            book_title,
-            filename=instr_filename,
-            background_path=global_background,
-            theme=theme,
-            **layout_kwargs,
+        instr_filename = build_output_file(output_dir, "02_instructions.png")
+        rendered.content_imgs.append(
+            render_instructions_page(
+                book_title,
+                filename=instr_filename,
+                background_path=global_background,
+                theme=theme,
+                **layout_kwargs,
+            )
         )
-    )
 
-    current_block_name = ""
-    block_index = 0
-
-    for generated in generated_puzzles:
-        spec = generated.spec
-        block_name = getattr(spec, "block_name", "") or ""
-        declared_bg_path = getattr(spec, "block_background", None)
-        bg_path = _block_background(asset_manifest, block_name, declared_bg_path)
-
-        if block_name and block_name != current_block_name:
-            current_block_name = block_name
-            block_index += 1
-            block_cover_filename = build_output_file(
-                output_dir,
-                f"block_{block_index:02d}_{slugify(block_name)}.png",
-            )
+    with render_executor(workers) as executor:
+        current_block_name = ""
+        block_index = 0
+        page_pairs = []
+
+        for generated in generated_puzzles:
+            spec = generated.spec
+            block_name = getattr(spec, "block_name", "") or ""
+            declared_bg_path = getattr(spec, "block_background", None)
+            bg_path = _block_background(asset_manifest, block_name, declared_bg_path)
+
+            if block_name and block_name != current_block_name:
+                current_block_name = block_name
+                block_index += 1
+                block_cover_filename = build_output_file(
+                    output_dir,
+                    f"block_{block_index:02d}_{slugify(block_name)}.png",
+                )
+                rendered.content_imgs.append(
+                    render_block_cover(
+                        block_name=block_name,
+                        block_index=block_index,
+                        filename=block_cover_filename,
+                        background_path=_block_cover_background(asset_manifest, block_name, declared_bg_path),
+                        theme=theme,
+                        **layout_kwargs,
+                    )
+                )
+
+            solution_page_number = page_plan.first_solution_page + spec.index
+            puzzle_filename = build_output_file(output_dir, f"puzzle_{spec.index + 1}.png")
+            solution_filename = build_output_file(output_dir, f"puzzle_{spec.index + 1}_sol.png")
+
             rendered.content_imgs.append(
-                render_block_cover(
-                    block_name=block_name,
-                    block_index=block_index,
-                    filename=block_cover_filename,
-                    background_path=_block_cover_background(asset_manifest, block_name, declared_bg_path),
+                _submit_page(
+                    executor,
+                    render_cache_dir,
+                    render_page,
+                    generated.grid,
+                    spec.words,
+                    spec.index + 1,
+                    filename=puzzle_filename,
+                    puzzle_title=spec.title,
+                    fun_fact=spec.fact,
+                    solution_page_number=solution_page_number,
+                    background_path=bg_path,
                     theme=theme,
                     **layout_kwargs,
                 )
             )
 
-        solution_page_number = page_plan.first_solution_page + spec.index
-        puzzle_filename = build_output_file(output_dir, f"puzzle_{spec.index + 1}.png")
-        solution_filename = build_output_file(output_dir, f"puzzle_{spec.index + 1}_sol.png")
-
-        rendered.content_imgs.append(
-            render_page(
-                generated.grid,
-                spec.words,
-                spec.index + 1,
-                filename=puzzle_filename,
-                puzzle_title=spec.title,
-                fun_fact=spec.fact,
-                solution_page_number=solution_page_number,
-                background_path=bg_path,
-                theme=theme,
-                **layout_kwargs,
-            )
-        )
-
-        rendered.solution_imgs.append(
-            render_solution_page(
-                generated.grid,
-                spec.words,
-                spec.index + 1,
-                filename=solution_filename,
-                placed_words=generated.placed_words,
-                puzzle_title=spec.title,
-                background_path=bg_path,
-                theme=theme,
-                **layout_kwargs,
+            rendered.solution_imgs.append(
+                _submit_page(
+                    executor,
+                    render_cache_dir,
+                    render_solution_page,
+                    generated.grid,
+                    spec.words,
+                    spec.index + 1,
+                    filename=solution_filename,
+                    placed_words=generated.placed_words,
+                    puzzle_title=spec.title,
+                    background_path=bg_path,
+                    theme=theme,
+                    **layout_kwargs,
+                )
             )
-        )
-        if progress_callback is not None:
-            progress_callback()
+            page_pairs.append((rendered.content_imgs[-1], rendered.solution_imgs[-1]))
+            if executor is None and progress_callback is not None:
+                progress_callback()
+
+        if executor is not None:
+            # Wait for one puzzle/solution pair at a time, in submission order,
+            # so progress follows the pool instead of jumping at the end.
+            for pending_pair in page_pairs:
+                resolve_renders(pending_pair)
+                if progress_callback is not None:
+                    progress_callback()
+            rendered.content_imgs = resolve_renders(rendered.content_imgs)
+            rendered.solution_imgs = resolve_renders(rendered.solution_imgs)
 
     return rendered
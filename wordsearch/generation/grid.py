@@ -5,6 +5,7 @@ Word search grid generation.
 from __future__ import annotations
 
 import random
+from functools import lru_cache
 from typing import Iterable
 
 from wordsearch.domain.grid import (
@@ -35,38 +36,56 @@ def _normalize_generation_words(words: Iterable[str]) -> list[str]:
     return [str(word).upper() for word in words if str(word).strip()]
 
 
+@lru_cache(maxsize=32)
 def _candidate_positions(
     size: int,
-    directions: list[tuple[int, int]],
-) -> list[tuple[int, int, int, int]]:
-    return [
+    directions: tuple[tuple[int, int], ...],
+) -> tuple[tuple[int, int, int, int], ...]:
+    """Return every (row, col, direction) start in canonical order.
+
+    The tuple is shared by every word, attempt and puzzle with the same grid
+    size and difficulty; callers shuffle a list copy of it.
+    """
+    return tuple(
         (row, col, d_row, d_col)
         for row in range(size)
         for col in range(size)
         for d_row, d_col in directions
-    ]
+    )
 
 
-def _can_place_word(
+def _find_placement(
     grid: list[list[str]],
     word: str,
-    row: int,
-    col: int,
-    d_row: int,
-    d_col: int,
-) -> bool:
-    size = len(grid)
-    rr, cc = row, col
+    candidates: Iterable[tuple[int, int, int, int]],
+) -> tuple[int, int, int, int] | None:
+    """Return the first candidate where ``word`` fits, or ``None``.
 
-    for char in word:
-        if not (0 <= rr < size and 0 <= cc < size):
-            return False
-        if grid[rr][cc] not in ("", char):
-            return False
-        rr += d_row
-        cc += d_col
+    Words run in straight lines from an on-board start, so they stay on the
+    board iff their last letter does: bounds are checked once per candidate
+    and the letter loop only looks for conflicts.
+    """
+    size = len(grid)
+    last = len(word) - 1
+
+    for candidate in candidates:
+        row, col, d_row, d_col = candidate
+        end_row = row + d_row * last
+        end_col = col + d_col * last
+        if not (0 <= end_row < size and 0 <= end_col < size):
+            continue
+
+        rr, cc = row, col
+        for char in word:
+            cell = grid[rr][cc]
+            if cell and cell != char:
+                break
+            rr += d_row
+            cc += d_col
+        else:
+            return candidate
 
-    return True
+    return None
 
 
 def _place_word(
@@ -92,32 +111,32 @@ def _try_generate_once(
     rng: random.Random,
 ) -> GridGenerationResult | None:
     settings = difficulty_settings[difficulty]
-    directions = settings["directions"]
+    base_candidates = _candidate_positions(size, tuple(settings["directions"]))
     grid = [["" for _ in range(size)] for _ in range(size)]
     placed_words: list[PlacedWord] = []
 
     for word in sorted(words, key=len, reverse=True):
-        candidates = _candidate_positions(size, directions)
+        # Copying the canonical order before shuffling keeps seeded grids
+        # identical to building the candidate list from scratch per word.
+        candidates = list(base_candidates)
         rng.shuffle(candidates)
 
-        for row, col, d_row, d_col in candidates:
-            if not _can_place_word(grid, word, row, col, d_row, d_col):
-                continue
-
-            _place_word(grid, word, row, col, d_row, d_col)
-            placed_words.append(
-                PlacedWord(
-                    word=word,
-                    row=row,
-                    col=col,
-                    d_row=d_row,
-                    d_col=d_col,
-                )
-            )
-            break
-        else:
+        placement = _find_placement(grid, word, candidates)
+        if placement is None:
             return None
 
+        row, col, d_row, d_col = placement
+        _place_word(grid, word, row, col, d_row, d_col)
+        placed_words.append(
+            PlacedWord(
+                word=word,
+                row=row,
+                col=col,
+                d_row=d_row,
+                d_col=d_col,
+            )
+        )
+
     for row in range(size):
         for col in range(size):
             if grid[row][col] == "":
@@ -9,6 +9,7 @@ from wordsearch.config.paths import BASE_OUTPUT_DIR, build_book_output_dir, buil
 from wordsearch.domain.book import SimpleGenerationOptions
 from wordsearch.domain.grid import GridGenerationFailure
 from wordsearch.generation.grid import generate_word_search_grid
+from wordsearch.rendering.batch import render_executor, resolve_renders, submit_render
 from wordsearch.rendering.pdf import generate_pdf
 from wordsearch.rendering.puzzle_page import render_page
 from wordsearch.rendering.solution_page import render_solution_page
@@ -74,44 +75,66 @@ def generate_simple_book(options: SimpleGenerationOptions) -> str | None:
     solutions = []
 
     print_section("Puzzle generation")
-    for puzzle_number in track_progress(
-        range(1, options.total_puzzles + 1),
-        description="Generating puzzle and solution pages",
-        total=options.total_puzzles,
-    ):
-        words = list(options.wordlists[(puzzle_number - 1) % len(options.wordlists)])
-        _WORD_SHUFFLER.shuffle(words)
-
-        grid_result = generate_word_search_grid(
-            words,
-            difficulty=options.difficulty,
-            grid_size=options.grid_size,
-            max_attempts=DEFAULT_MAX_GRID_ATTEMPTS,
-        )
-        if isinstance(grid_result, GridGenerationFailure):
-            print_warning(
-                f"Puzzle #{puzzle_number}: no valid grid could be generated "
-                f"after {DEFAULT_MAX_GRID_ATTEMPTS} attempts."
+    with render_executor(options.workers) as executor:
+        puzzle_numbers = range(1, options.total_puzzles + 1)
+        if executor is None:
+            # Inline renders finish at submission time, so the bar follows the loop.
+            puzzle_numbers = track_progress(
+                puzzle_numbers,
+                description="Generating puzzle and solution pages",
+                total=options.total_puzzles,
             )
-            print_info("The word list is probably too dense for this grid size.")
-            print_info("Adjust the list or grid size and try again.")
-            return None
-
-        puzzle_img = render_page(
-            grid_result.grid,
-            words,
-            puzzle_number,
-            filename=build_output_file(output_dir, f"puzzle_{puzzle_number}.png"),
-        )
-        solution_img = render_solution_page(
-            grid_result.grid,
-            words,
-            puzzle_number,
-            filename=build_output_file(output_dir, f"puzzle_{puzzle_number}_sol.png"),
-            placed_words=grid_result.placed_words,
-        )
-        puzzles.append(puzzle_img)
-        solutions.append(solution_img)
+        pending = []
+        for puzzle_number in puzzle_numbers:
+            words = list(options.wordlists[(puzzle_number - 1) % len(options.wordlists)])
+            _WORD_SHUFFLER.shuffle(words)
+
+            grid_result = generate_word_search_grid(
+                words,
+                difficulty=options.difficulty,
+                grid_size=options.grid_size,
+                max_attempts=DEFAULT_MAX_GRID_ATTEMPTS,
+            )
+            if isinstance(grid_result, GridGenerationFailure):
+                print_warning(
+                    f"Puzzle #{puzzle_number}: no valid grid could be generated "
+                    f"after {DEFAULT_MAX_GRID_ATTEMPTS} attempts."
+                )
+                print_info("The word list is probably too dense for this grid size.")
+                print_info("Adjust the list or grid size and try again.")
+                return None
+
+            pending.append(
+                (
+                    submit_render(
+                        executor,
+                        render_page,
+                        grid_result.grid,
+                        words,
+                        puzzle_number,
+                        filename=build_output_file(output_dir, f"puzzle_{puzzle_number}.png"),
+                    ),
+                    submit_render(
+                        executor,
+                        render_solution_page,
+                        grid_result.grid,
+                        words,
+                        puzzle_number,
+                        filename=build_output_file(output_dir, f"puzzle_{puzzle_number}_sol.png"),
+                        placed_words=grid_result.placed_words,
+                    ),
+                )
+            )
+        if executor is not None:
+            # Pooled renders complete later; advance only as each page pair resolves.
+            pending = track_progress(
+                pending,
+                description="Rendering puzzle and solution pages",
+                total=len(pending),
+            )
+        for puzzle, solution in pending:
+            puzzles.extend(resolve_renders([puzzle]))
+            solutions.extend(resolve_renders([solution]))
     print_success(f"Generated {len(puzzles)} puzzles and {len(solutions)} solution pages")
 
     print_section("PDF assembly")
@@ -34,6 +34,7 @@ from wordsearch.generation.reporting import build_thematic_generation_report, wr
 from wordsearch.generation.review_summary import build_production_review_summary, write_production_review_summary
 from wordsearch.parsing.thematic import PuzzleParseError, parse_puzzle_file
 from wordsearch.rendering.pdf import generate_pdf
+from wordsearch.rendering.render_cache import RENDER_CACHE_DIR, prune_render_cache
 from wordsearch.validation.asset_manifest import validate_asset_manifest_assets
 from wordsearch.validation.assets import validate_generation_assets
 from wordsearch.validation.kdp import build_kdp_preflight_report, write_kdp_preflight_report
@@ -288,6 +289,13 @@ def generate_thematic_book(options: ThematicGenerationOptions) -> str | None:
     if options.theme_name != DEFAULT_THEME_NAME:
         render_kwargs["theme"] = theme
     render_kwargs.update(format_kwargs)
+    if options.workers > 1:
+        render_kwargs["workers"] = options.workers
+    if options.render_cache:
+        removed = prune_render_cache(RENDER_CACHE_DIR)
+        if removed:
+            print_info(f"Render cache: removed {removed} stale files from {RENDER_CACHE_DIR}")
+        render_kwargs["render_cache_dir"] = RENDER_CACHE_DIR
     with create_progress() as progress:
         task_id = progress.add_task("Rendering puzzle and solution pages", total=len(generated_puzzles))
         rendered_images = _render_thematic_book_images_with_optional_progress(
@@ -319,6 +327,9 @@ def generate_thematic_book(options: ThematicGenerationOptions) -> str | None:
     print_section("PDF assembly")
     pdf_path = build_output_file(output_dir, f"{book_slug}.pdf")
     pdf_metadata = build_pdf_metadata(options)
+    pdf_kwargs = dict(format_kwargs)
+    if options.pdf_jpeg_quality is not None:
+        pdf_kwargs["jpeg_quality"] = options.pdf_jpeg_quality
     try:
         with create_progress() as progress:
             task_id = progress.add_task("Building final PDF", total=1)
@@ -327,7 +338,7 @@ def generate_thematic_book(options: ThematicGenerationOptions) -> str | None:
                 rendered_images.solution_imgs,
                 outname=pdf_path,
                 metadata=pdf_metadata,
-                **format_kwargs,
+                **pdf_kwargs,
             )
             progress.update(task_id, advance=1)
     except PermissionError:
@@ -16,9 +16,6 @@ def parse_puzzle_file(path: str) -> list[PuzzleSpec]:
     Supports the classic [Puzzle] ... [/Puzzle] format and optional [Block]
     sections that provide inherited block metadata for subsequent puzzles.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        lines = [line.rstrip("\n") for line in f]
-
     specs: list[PuzzleSpec] = []
 
     current_block_name: str | None = None
@@ -26,59 +23,57 @@ def parse_puzzle_file(path: str) -> list[PuzzleSpec]:
     puzzle_index = 0
     block_index = 0
 
-    i = 0
-    line_count = len(lines)
-
-    while i < line_count:
-        stripped = lines[i].strip()
-
-        if stripped == "[Block]":
-            start = i + 1
-            end = start
-            while end < line_count and lines[end].strip() != "[/Block]":
-                end += 1
-            if end >= line_count:
-                raise PuzzleParseError("Falta '[/Block]' de cierre para un bloque [Block].")
-
-            block_lines = lines[start:end]
-            current_block_name, current_block_background = _parse_block_block(
-                block_lines,
-                block_index,
-            )
-            block_index += 1
-            i = end + 1
-            continue
+    # Single forward pass: each line is stripped once and either opens a
+    # section, closes the open one, or is buffered as part of it.
+    closing_tag: str | None = None
+    section_lines: list[str] = []
 
-        if stripped == "[Puzzle]":
-            start = i + 1
-            end = start
-            while end < line_count and lines[end].strip() != "[/Puzzle]":
-                end += 1
-            if end >= line_count:
-                raise PuzzleParseError("Falta '[/Puzzle]' de cierre para un bloque [Puzzle].")
-
-            puzzle_lines = lines[start:end]
-            spec = _parse_single_block(puzzle_lines, puzzle_index)
-            spec.block_name = current_block_name
-            spec.block_background = current_block_background
-
-            specs.append(spec)
-            puzzle_index += 1
-            i = end + 1
-            continue
-
-        i += 1
+    with open(path, "r", encoding="utf-8") as f:
+        for raw in f:
+            line = raw.strip()
+
+            if closing_tag is None:
+                if line == "[Block]":
+                    closing_tag = "[/Block]"
+                elif line == "[Puzzle]":
+                    closing_tag = "[/Puzzle]"
+                continue
+
+            if line != closing_tag:
+                section_lines.append(line)
+                continue
+
+            if closing_tag == "[/Block]":
+                current_block_name, current_block_background = _parse_block_block(
+                    section_lines,
+                    block_index,
+                )
+                block_index += 1
+            else:
+                spec = _parse_single_block(section_lines, puzzle_index)
+                spec.block_name = current_block_name
+                spec.block_background = current_block_background
+
+                specs.append(spec)
+                puzzle_index += 1
+
+            closing_tag = None
+            section_lines = []
+
+    if closing_tag == "[/Block]":
+        raise PuzzleParseError("Falta '[/Block]' de cierre para un bloque [Block].")
+    if closing_tag == "[/Puzzle]":
+        raise PuzzleParseError("Falta '[/Puzzle]' de cierre para un bloque [Puzzle].")
 
     return specs
 
 
 def _parse_block_block(block_lines: list[str], index: int) -> tuple[str, str | None]:
-    """Parse one [Block] ... [/Block] section."""
+    """Parse one [Block] ... [/Block] section from already stripped lines."""
     name: str | None = None
     background: str | None = None
 
-    for raw in block_lines:
-        line = raw.strip()
+    for line in block_lines:
         if not line:
             continue
         lower = line.lower()
@@ -99,8 +94,7 @@ def _parse_single_block(block_lines: list[str], index: int) -> PuzzleSpec:
     words: list[str] = []
 
     mode = "header"
-    for raw in block_lines:
-        line = raw.strip()
+    for line in block_lines:
         if not line:
             continue
 
@@ -123,11 +117,4 @@ def _parse_single_block(block_lines: list[str], index: int) -> PuzzleSpec:
     if not words:
         raise PuzzleParseError(f"Puzzle {index}: no se han definido palabras tras 'words:'")
 
-    seen = set()
-    clean_words: list[str] = []
-    for word in words:
-        if word not in seen:
-            seen.add(word)
-            clean_words.append(word)
-
-    return PuzzleSpec(index=index, title=title.strip(), fact=fact.strip(), words=clean_words)
+    return PuzzleSpec(index=index, title=title.strip(), fact=fact.strip(), words=list(dict.fromkeys(words)))
@@ -1,3 +1,63 @@
-"""Shared rendering background configuration."""
+"""Shared rendering background configuration and loading."""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+
+from PIL import Image
+
+from wordsearch.rendering.common import opacity_lut
 
 BACKGROUND_PATH = "assets/world.png"
+
+
+def _scale_background(
+    path: str,
+    size: tuple[int, int],
+    opacity: float,
+    resample: int,
+    mode: str,
+) -> Image.Image:
+    """Decode, resize and dim one background."""
+    bg = Image.open(path).convert("RGBA")
+    bg = bg.resize(size, resample)
+    bg.putalpha(bg.getchannel("A").point(opacity_lut(opacity)))
+    return bg if mode == "RGBA" else bg.convert(mode)
+
+
+@lru_cache(maxsize=4)
+def _load_scaled_background(
+    path: str,
+    mtime_ns: int,
+    size: tuple[int, int],
+    opacity: float,
+    resample: int,
+    mode: str = "RGBA",
+) -> Image.Image:
+    """Cached _scale_background; keyed by mtime so edited files reload."""
+    return _scale_background(path, size, opacity, resample, mode)
+
+
+def load_page_background(
+    path: str | None,
+    size: tuple[int, int],
+    opacity: float,
+    *,
+    resample: int = Image.LANCZOS,
+    mode: str = "RGBA",
+    cached: bool = False,
+) -> Image.Image | None:
+    """Return a private copy of the translucent page background, or None if it is missing.
+
+    Pass ``cached=True`` only for the per-page background that repeats across
+    the book: the decoded, resized and mode-converted image is then shared and
+    each page only pays for one copy. One-off supersampled pages decode it
+    directly, since their 3x rasters are too large to keep around.
+    """
+    if not path or not os.path.exists(path):
+        return None
+    if not cached:
+        return _scale_background(path, size, opacity, resample, mode)
+    background = _load_scaled_background(path, os.stat(path).st_mtime_ns, size, opacity, resample, mode)
+    return background.copy()
@@ -0,0 +1,35 @@
+"""Optional process-pool execution for independent page renders."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import List
+
+
+@contextmanager
+def render_executor(workers: int = 1) -> Iterator[Executor | None]:
+    """Yield a process pool for ``workers > 1``, or None to render inline.
+
+    Page renderers are pure functions of their arguments and write their own
+    PNG, so puzzle and solution pages can be rendered in any order. Font,
+    background and glyph caches are per process and warm up in each worker.
+    """
+    if workers <= 1:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield executor
+
+
+def submit_render(executor: Executor | None, render: Callable[..., str], *args, **kwargs) -> str | Future:
+    """Run ``render`` inline without an executor, otherwise schedule it."""
+    if executor is None:
+        return render(*args, **kwargs)
+    return executor.submit(render, *args, **kwargs)
+
+
+def resolve_renders(items: Sequence[str | Future]) -> List[str]:
+    """Return rendered paths in submission order, waiting for pending pages."""
+    return [item.result() if isinstance(item, Future) else item for item in items]
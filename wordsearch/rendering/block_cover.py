@@ -32,7 +32,7 @@ def render_block_cover(
     page_w_hi = layout.page_width_px * scale
     page_h_hi = layout.page_height_px * scale
 
-    img = create_page_canvas(background_path, scale, theme=theme, layout=layout)
+    img = create_page_canvas(background_path, scale, theme=theme, layout=layout, mode="RGB")
     draw = ImageDraw.Draw(img)
 
     margin_x = int(page_w_hi * 0.10)
@@ -77,14 +77,9 @@ def render_block_cover(
     shadow_offset = int(3 * scale)
 
     for line in title_lines:
-        width, height = text_size(draw, line, font_title)
-        try:
-            draw.text((center_x + shadow_offset, y + height / 2 + shadow_offset), line, font=font_title, fill=shadow_color, anchor="mm")
-            draw.text((center_x, y + height / 2), line, font=font_title, fill=main_color, anchor="mm")
-        except TypeError:
-            x = center_x - width / 2
-            draw.text((x + shadow_offset, y + shadow_offset), line, font=font_title, fill=shadow_color)
-            draw.text((x, y), line, font=font_title, fill=main_color)
+        _, height = text_size(draw, line, font_title)
+        draw.text((center_x + shadow_offset, y + height / 2 + shadow_offset), line, font=font_title, fill=shadow_color, anchor="mm")
+        draw.text((center_x, y + height / 2), line, font=font_title, fill=main_color, anchor="mm")
         y += line_height
 
     subtitle = "A themed collection of word search puzzles"
@@ -98,13 +93,8 @@ def render_block_cover(
 
     subtitle_y = y + subtitle_gap
     subtitle_shadow = _shadow_for(body_color, alpha=70)
-    try:
-        draw.text((center_x + shadow_offset, subtitle_y + sub_h / 2 + shadow_offset), subtitle, font=font_sub, fill=subtitle_shadow, anchor="mm")
-        draw.text((center_x, subtitle_y + sub_h / 2), subtitle, font=font_sub, fill=body_color, anchor="mm")
-    except TypeError:
-        sx = center_x - sub_w / 2
-        draw.text((sx + shadow_offset, subtitle_y + shadow_offset), subtitle, font=font_sub, fill=subtitle_shadow)
-        draw.text((sx, subtitle_y), subtitle, font=font_sub, fill=body_color)
+    draw.text((center_x + shadow_offset, subtitle_y + sub_h / 2 + shadow_offset), subtitle, font=font_sub, fill=subtitle_shadow, anchor="mm")
+    draw.text((center_x, subtitle_y + sub_h / 2), subtitle, font=font_sub, fill=body_color, anchor="mm")
 
     if filename is None:
         filename = build_default_output_file(f"block_{block_index}.png")
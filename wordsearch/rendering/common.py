@@ -2,50 +2,91 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import List, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
 
+from wordsearch.config.design import DEFAULT_LAYOUT, LayoutConfig
 from wordsearch.config.layout import DPI, PAGE_H_PX, PAGE_W_PX
 
+# Page PNGs are intermediates that get repacked into the PDF, so favour a
+# fast encode over the smallest file (zlib level 1 vs Pillow's default 6).
+PNG_COMPRESS_LEVEL = 1
 
+
+@lru_cache(maxsize=64)
 def load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
-    """Load a TrueType font, falling back to Pillow's default font."""
+    """Load a TrueType font, falling back to Pillow's default font.
+
+    Fonts are cached by ``(path, size)``: every page asks for the same handful
+    of faces, and Pillow font objects are never mutated by the renderers.
+    """
     try:
         return ImageFont.truetype(path, size)
     except Exception:
         return ImageFont.load_default()
 
 
+@lru_cache(maxsize=16)
+def opacity_lut(opacity: float) -> bytes:
+    """Return a 256-entry table that scales 8-bit values by ``opacity`` for ``Image.point``."""
+    return bytes(int(value * opacity) for value in range(256))
+
+
 def text_size(
     draw: ImageDraw.ImageDraw,
     text: str,
     font: ImageFont.FreeTypeFont,
 ) -> Tuple[int, int]:
-    """Return text width and height using Pillow's textbbox API."""
-    bbox = draw.textbbox((0, 0), text, font=font)
+    """Return text width and height using Pillow's textbbox API.
+
+    Single-line measurements are memoised per ``(text, font)``: word lists,
+    pills and wrapped paragraphs measure the same strings over and over.
+    """
+    if "\n" in text:
+        bbox = draw.textbbox((0, 0), text, font=font)
+    else:
+        bbox = _text_bbox(text, font)
     return bbox[2] - bbox[0], bbox[3] - bbox[1]
 
 
+@lru_cache(maxsize=4096)
+def _text_bbox(text: str, font: ImageFont.FreeTypeFont) -> Tuple[int, int, int, int]:
+    """Cached equivalent of ``draw.textbbox((0, 0), text, font=font)``."""
+    return font.getbbox(text)
+
+
 def wrap_text(
     draw: ImageDraw.ImageDraw,
     text: str,
     font: ImageFont.FreeTypeFont,
     max_width: int,
 ) -> List[str]:
-    """Wrap text into lines that fit within max_width."""
+    """Wrap text into lines that fit within max_width.
+
+    Line widths are accumulated from per-word advance widths instead of
+    re-measuring the growing line for every word.
+    """
     words = text.split()
     lines: List[str] = []
     current: List[str] = []
+    current_width = 0.0
+    space_width = font.getlength(" ")
+    word_widths: dict[str, float] = {}
 
     for word in words:
-        candidate = " ".join(current + [word]).strip()
-        width, _ = text_size(draw, candidate, font)
-        if width <= max_width or not current:
+        word_width = word_widths.get(word)
+        if word_width is None:
+            word_width = word_widths[word] = font.getlength(word)
+        candidate_width = current_width + space_width + word_width if current else word_width
+        if candidate_width <= max_width or not current:
             current.append(word)
+            current_width = candidate_width
         else:
             lines.append(" ".join(current))
             current = [word]
+            current_width = word_width
 
     if current:
         lines.append(" ".join(current))
@@ -61,19 +102,8 @@ def rounded_rectangle(
     outline=None,
     width: int = 1,
 ) -> None:
-    """Draw a rounded rectangle with fallback for older Pillow versions."""
-    try:
-        draw.rounded_rectangle(xy, radius=radius, fill=fill, outline=outline, width=width)
-    except AttributeError:
-        x1, y1, x2, y2 = xy
-        draw.rectangle((x1, y1 + radius, x2, y2 - radius), fill=fill)
-        draw.rectangle((x1 + radius, y1, x2 - radius, y2), fill=fill)
-        draw.pieslice((x1, y1, x1 + 2 * radius, y1 + 2 * radius), 180, 270, fill=fill)
-        draw.pieslice((x2 - 2 * radius, y1, x2, y1 + 2 * radius), 270, 360, fill=fill)
-        draw.pieslice((x1, y2 - 2 * radius, x1 + 2 * radius, y2), 90, 180, fill=fill)
-        draw.pieslice((x2 - 2 * radius, y2 - 2 * radius, x2, y2), 0, 90, fill=fill)
-        if outline:
-            draw.rectangle(xy, outline=outline, width=width)
+    """Draw a rounded rectangle."""
+    draw.rounded_rectangle(xy, radius=radius, fill=fill, outline=outline, width=width)
 
 
 def draw_centered_text(
@@ -90,6 +120,26 @@ def draw_centered_text(
     return y + height
 
 
+def draw_centered_text_in_box(
+    draw: ImageDraw.ImageDraw,
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    *,
+    center_x: float,
+    center_y: float,
+    fill,
+) -> None:
+    """Draw text centered on its optical box."""
+    draw.text((center_x, center_y), text, font=font, fill=fill, anchor="mm")
+
+
+def format_visual_scale(layout: LayoutConfig = DEFAULT_LAYOUT, *, max_scale: float = 1.15) -> float:
+    """Return a modest scale factor so larger trims do not look under-designed."""
+    width_scale = layout.page_width_px / DEFAULT_LAYOUT.page_width_px
+    height_scale = layout.page_height_px / DEFAULT_LAYOUT.page_height_px
+    return min(max_scale, max(1.0, min(width_scale, height_scale)))
+
+
 def draw_centered_lines(
     draw: ImageDraw.ImageDraw,
     lines: List[str],
@@ -124,9 +174,11 @@ def save_page(
     output_width_px: int = PAGE_W_PX,
     output_height_px: int = PAGE_H_PX,
     dpi: int = DPI,
+    resample: int = Image.LANCZOS,
 ) -> str:
     """Save a high-resolution RGBA/RGB page image at the selected KDP size."""
-    img_rgb = img.convert("RGB")
-    img_final = img_rgb.resize((output_width_px, output_height_px), resample=Image.LANCZOS)
-    img_final.save(filename, dpi=(dpi, dpi))
+    img_final = img if img.mode == "RGB" else img.convert("RGB")
+    if img_final.size != (output_width_px, output_height_px):
+        img_final = img_final.resize((output_width_px, output_height_px), resample=resample)
+    img_final.save(filename, dpi=(dpi, dpi), compress_level=PNG_COMPRESS_LEVEL)
     return filename
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Optional, Sequence, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
@@ -16,18 +18,59 @@ from wordsearch.config.fonts import (
     wordlist_font_size as WORDLIST_FONT_SIZE,
 )
 from wordsearch.config.paths import build_default_output_file, build_output_file
-from wordsearch.rendering.backgrounds import BACKGROUND_PATH
-from wordsearch.rendering.common import draw_centered_text, load_font, rounded_rectangle, save_page, text_size, wrap_text
+from wordsearch.rendering.backgrounds import BACKGROUND_PATH, load_page_background
+from wordsearch.rendering.common import (
+    draw_centered_text,
+    draw_centered_text_in_box,
+    format_visual_scale,
+    load_font,
+    rounded_rectangle,
+    save_page,
+    text_size,
+    wrap_text,
+)
 
 TocEntry = Tuple[str, int, bool]
 InstructionEntry = str | tuple[str, str]
 
-
-def _format_visual_scale(layout: LayoutConfig = DEFAULT_LAYOUT) -> float:
-    """Return a modest scale factor so larger trims do not look under-designed."""
-    width_scale = layout.page_width_px / DEFAULT_LAYOUT.page_width_px
-    height_scale = layout.page_height_px / DEFAULT_LAYOUT.page_height_px
-    return min(1.16, max(1.0, min(width_scale, height_scale)))
+# Front matter is supersampled by an integer factor and is mostly text/linework that is
+# already anti-aliased, so a box average is enough for the final downscale.
+FRONT_MATTER_DOWNSCALE = Image.Resampling.BOX
+# The background is dimmed and mostly covered by the main panel, so its fine detail
+# never survives; a narrower kernel than LANCZOS is enough.
+FRONT_MATTER_BACKGROUND_RESAMPLE = Image.Resampling.HAMMING
+# Front matter is allowed to grow slightly more than puzzle pages on larger trims.
+FRONT_MATTER_MAX_VISUAL_SCALE = 1.16
+
+
+@dataclass(frozen=True)
+class _PageHeader:
+    """Static header text and proportions shared by every copy of a front-matter page."""
+
+    title: str
+    subtitle: str
+    label: str
+    title_scale: float
+    rule_width_ratio: float
+    label_gap_px: int
+
+
+TOC_HEADER = _PageHeader(
+    title="Contents",
+    subtitle="A guided path through every puzzle section",
+    label="BOOK MAP",
+    title_scale=1.02,
+    rule_width_ratio=0.46,
+    label_gap_px=24,
+)
+INSTRUCTIONS_HEADER = _PageHeader(
+    title="How to Use This Book",
+    subtitle="Find the words, enjoy the facts, check the answers when needed.",
+    label="PLAY GUIDE",
+    title_scale=0.96,
+    rule_width_ratio=0.42,
+    label_gap_px=18,
+)
 
 
 def _make_background(
@@ -36,19 +79,22 @@ def _make_background(
     *,
     theme: ThemeConfig = DEFAULT_THEME,
     layout: LayoutConfig = DEFAULT_LAYOUT,
+    mode: str = "RGBA",
 ) -> Image.Image:
     width_hi = layout.page_width_px * scale
     height_hi = layout.page_height_px * scale
-    bg_path = background_path or BACKGROUND_PATH
-
-    if bg_path and os.path.exists(bg_path):
-        img = Image.open(bg_path).convert("RGBA")
-        img = img.resize((width_hi, height_hi), Image.LANCZOS)
-        r, g, b, a = img.split()
-        a = a.point(lambda value: int(value * theme.background_opacity))
-        return Image.merge("RGBA", (r, g, b, a))
+    img = load_page_background(
+        background_path or BACKGROUND_PATH,
+        (width_hi, height_hi),
+        theme.background_opacity,
+        resample=FRONT_MATTER_BACKGROUND_RESAMPLE,
+        mode=mode,
+    )
+    if img is not None:
+        return img
 
-    return Image.new("RGBA", (width_hi, height_hi), theme.page_background_fill)
+    img = Image.new("RGBA", (width_hi, height_hi), theme.page_background_fill)
+    return img if mode == "RGBA" else img.convert(mode)
 
 
 def _draw_main_panel(
@@ -114,25 +160,6 @@ def _draw_centered_rule(
     return y + int(34 * scale)
 
 
-def _draw_centered_text_in_box(
-    draw: ImageDraw.ImageDraw,
-    text: str,
-    font: ImageFont.FreeTypeFont,
-    *,
-    center_x: float,
-    center_y: float,
-    fill,
-) -> None:
-    """Draw text centered on its optical box, with a fallback for old Pillow versions."""
-    try:
-        draw.text((center_x, center_y), text, font=font, fill=fill, anchor="mm")
-    except TypeError:
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_w = bbox[2] - bbox[0]
-        text_h = bbox[3] - bbox[1]
-        draw.text((center_x - text_w / 2 - bbox[0], center_y - text_h / 2 - bbox[1]), text, font=font, fill=fill)
-
-
 def _draw_small_caps_label(
     draw: ImageDraw.ImageDraw,
     text: str,
@@ -161,7 +188,7 @@ def _draw_small_caps_label(
         outline=theme.pill_border,
         width=max(1, int(theme.pill_border_width_px * 0.65 * scale)),
     )
-    _draw_centered_text_in_box(
+    draw_centered_text_in_box(
         draw,
         text,
         font,
@@ -172,6 +199,101 @@ def _draw_small_caps_label(
     return box[3]
 
 
+def _draw_page_header(
+    draw: ImageDraw.ImageDraw,
+    header: _PageHeader,
+    *,
+    panel_bounds: Tuple[int, int, int, int],
+    scale: int,
+    theme: ThemeConfig,
+    layout: LayoutConfig,
+) -> int:
+    """Draw title, subtitle, rule and label chip; return the y position below them."""
+    panel_left, panel_top, panel_right, _panel_bottom = panel_bounds
+    visual_scale = format_visual_scale(layout, max_scale=FRONT_MATTER_MAX_VISUAL_SCALE)
+    center_x = layout.page_width_px * scale // 2
+    title_font = load_font(FONT_TITLE, int(TITLE_FONT_SIZE * header.title_scale * visual_scale) * scale)
+    subtitle_font = load_font(FONT_PATH, int(WORDLIST_FONT_SIZE * 0.52 * visual_scale) * scale)
+    chip_font = load_font(FONT_PATH_BOLD, int(WORDLIST_FONT_SIZE * 0.40 * visual_scale) * scale)
+
+    y = panel_top + int(78 * scale)
+    y = draw_centered_text(draw, header.title, title_font, center_x, y, theme.title_color)
+    y += int(70 * scale)
+    y = draw_centered_text(draw, header.subtitle, subtitle_font, center_x, y, theme.body_color)
+    y += int(58 * scale)
+    y = _draw_centered_rule(
+        draw,
+        center_x=center_x,
+        y=y,
+        width=int((panel_right - panel_left) * header.rule_width_ratio),
+        scale=scale,
+        theme=theme,
+    )
+    y += int(header.label_gap_px * scale)
+    return _draw_small_caps_label(draw, header.label, chip_font, center_x=center_x, y=y, scale=scale, theme=theme)
+
+
+_PageTemplate = tuple[Image.Image, Tuple[int, int, int, int]]
+# Templates shared inside an active shared_page_template() block; None outside it.
+_template_scope: dict[tuple, _PageTemplate] | None = None
+
+
+@contextmanager
+def shared_page_template() -> Iterator[None]:
+    """Let the front-matter pages rendered inside the block share one page template.
+
+    The template is a full 3x raster, so it is dropped when the block exits
+    instead of being kept for the life of the process.
+    """
+    global _template_scope
+    previous = _template_scope
+    _template_scope = {} if previous is None else previous
+    try:
+        yield
+    finally:
+        _template_scope = previous
+
+
+def _page_template(
+    background_path: Optional[str],
+    scale: int,
+    theme: ThemeConfig,
+    layout: LayoutConfig,
+) -> _PageTemplate:
+    """Return the background + main panel template; callers must copy the image.
+
+    Headers are drawn per page so the TOC and instructions pages reuse the same
+    template. Front matter never alpha-composites, so the template is kept in
+    RGB like the final PNG.
+    """
+    key = (background_path, scale, theme, layout)
+    if _template_scope is not None and key in _template_scope:
+        return _template_scope[key]
+    img = _make_background(background_path, scale, theme=theme, layout=layout, mode="RGB")
+    panel_bounds = _draw_main_panel(ImageDraw.Draw(img), scale, theme=theme, layout=layout)
+    if _template_scope is not None:
+        _template_scope[key] = (img, panel_bounds)
+    return img, panel_bounds
+
+
+def _new_page(
+    background_path: Optional[str],
+    scale: int,
+    *,
+    header: _PageHeader | None = None,
+    theme: ThemeConfig = DEFAULT_THEME,
+    layout: LayoutConfig = DEFAULT_LAYOUT,
+) -> tuple[Image.Image, ImageDraw.ImageDraw, Tuple[int, int, int, int], int]:
+    """Return a copy of the page template with its header, draw handle, panel bounds and content top."""
+    template, panel_bounds = _page_template(background_path, scale, theme, layout)
+    img = template.copy()
+    draw = ImageDraw.Draw(img)
+    content_top = panel_bounds[1]
+    if header is not None:
+        content_top = _draw_page_header(draw, header, panel_bounds=panel_bounds, scale=scale, theme=theme, layout=layout)
+    return img, draw, panel_bounds, content_top
+
+
 def _draw_instruction_card(
     draw: ImageDraw.ImageDraw,
     *,
@@ -209,7 +331,7 @@ def _draw_instruction_card(
         outline=None,
         width=0,
     )
-    _draw_centered_text_in_box(
+    draw_centered_text_in_box(
         draw,
         number_text,
         number_font,
@@ -248,35 +370,19 @@ def render_table_of_contents(
 ) -> list[str]:
     """Renderiza un índice editorial con jerarquía visual y dot leaders."""
     scale = 3
-    visual_scale = _format_visual_scale(layout)
-    img = _make_background(background_path, scale, theme=theme, layout=layout)
-    draw = ImageDraw.Draw(img)
-    panel_left, panel_top, panel_right, panel_bottom = _draw_main_panel(draw, scale, theme=theme, layout=layout)
+    visual_scale = format_visual_scale(layout, max_scale=FRONT_MATTER_MAX_VISUAL_SCALE)
+    img, draw, (panel_left, _panel_top, panel_right, panel_bottom), y = _new_page(
+        background_path,
+        scale,
+        header=TOC_HEADER,
+        theme=theme,
+        layout=layout,
+    )
 
-    center_x = layout.page_width_px * scale // 2
-    title_font = load_font(FONT_TITLE, int(TITLE_FONT_SIZE * 1.02 * visual_scale) * scale)
-    subtitle_font = load_font(FONT_PATH, int(WORDLIST_FONT_SIZE * 0.52 * visual_scale) * scale)
-    chip_font = load_font(FONT_PATH_BOLD, int(WORDLIST_FONT_SIZE * 0.40 * visual_scale) * scale)
     section_font = load_font(FONT_PATH_BOLD, int(WORDLIST_FONT_SIZE * 0.64 * visual_scale) * scale)
     entry_font = load_font(FONT_PATH, int(WORDLIST_FONT_SIZE * 0.70 * visual_scale) * scale)
     page_font = load_font(FONT_PATH_BOLD, int(WORDLIST_FONT_SIZE * 0.70 * visual_scale) * scale)
 
-    y = panel_top + int(78 * scale)
-    y = draw_centered_text(draw, "Contents", title_font, center_x, y, theme.title_color)
-    y += int(70 * scale)
-    y = draw_centered_text(draw, "A guided path through every puzzle section", subtitle_font, center_x, y, theme.body_color)
-    y += int(58 * scale)
-    y = _draw_centered_rule(
-        draw,
-        center_x=center_x,
-        y=y,
-        width=int((panel_right - panel_left) * 0.46),
-        scale=scale,
-        theme=theme,
-    )
-    y += int(24 * scale)
-    y = _draw_small_caps_label(draw, "BOOK MAP", chip_font, center_x=center_x, y=y, scale=scale, theme=theme)
-
     content_left = panel_left + int(74 * scale)
     content_right = panel_right - int(74 * scale)
     y += int(90 * scale)
@@ -342,7 +448,16 @@ def render_table_of_contents(
             y += max(label_height, page_height) + row_gap
 
     filename = build_output_file(output_dir, "01_table_of_contents.png")
-    return [save_page(img, filename, output_width_px=layout.page_width_px, output_height_px=layout.page_height_px, dpi=layout.dpi)]
+    return [
+        save_page(
+            img,
+            filename,
+            output_width_px=layout.page_width_px,
+            output_height_px=layout.page_height_px,
+            dpi=layout.dpi,
+            resample=FRONT_MATTER_DOWNSCALE,
+        )
+    ]
 
 
 def _split_instruction_entry(instruction: InstructionEntry) -> tuple[str, str]:
@@ -383,35 +498,20 @@ def render_instructions_page(
 ) -> str:
     """Renderiza una página de instrucciones con tarjetas compactas y jerarquía editorial."""
     scale = 3
-    visual_scale = _format_visual_scale(layout)
-    img = _make_background(background_path, scale, theme=theme, layout=layout)
-    draw = ImageDraw.Draw(img)
-    panel_left, panel_top, panel_right, panel_bottom = _draw_main_panel(draw, scale, theme=theme, layout=layout)
+    visual_scale = format_visual_scale(layout, max_scale=FRONT_MATTER_MAX_VISUAL_SCALE)
+    img, draw, (panel_left, _panel_top, panel_right, panel_bottom), y = _new_page(
+        background_path,
+        scale,
+        header=INSTRUCTIONS_HEADER,
+        theme=theme,
+        layout=layout,
+    )
 
     center_x = layout.page_width_px * scale // 2
-    title_font = load_font(FONT_TITLE, int(TITLE_FONT_SIZE * 0.96 * visual_scale) * scale)
-    subtitle_font = load_font(FONT_PATH, int(WORDLIST_FONT_SIZE * 0.52 * visual_scale) * scale)
-    chip_font = load_font(FONT_PATH_BOLD, int(WORDLIST_FONT_SIZE * 0.40 * visual_scale) * scale)
     number_font = load_font(FONT_PATH_BOLD, int(WORDLIST_FONT_SIZE * 0.66 * visual_scale) * scale)
     card_title_font = load_font(FONT_PATH_BOLD, int(WORDLIST_FONT_SIZE * 0.50 * visual_scale) * scale)
     body_font = load_font(FONT_PATH, int(WORDLIST_FONT_SIZE * 0.47 * visual_scale) * scale)
 
-    y = panel_top + int(78 * scale)
-    y = draw_centered_text(draw, "How to Use This Book", title_font, center_x, y, theme.title_color)
-    y += int(70 * scale)
-    y = draw_centered_text(draw, "Find the words, enjoy the facts, check the answers when needed.", subtitle_font, center_x, y, theme.body_color)
-    y += int(58 * scale)
-    y = _draw_centered_rule(
-        draw,
-        center_x=center_x,
-        y=y,
-        width=int((panel_right - panel_left) * 0.42),
-        scale=scale,
-        theme=theme,
-    )
-    y += int(18 * scale)
-    y = _draw_small_caps_label(draw, "PLAY GUIDE", chip_font, center_x=center_x, y=y, scale=scale, theme=theme)
-
     instructions = [
         ("Scan the word bank", "Start with the list at the bottom of each puzzle page."),
         ("Search every direction", "Words can run horizontally, vertically or diagonally depending on the difficulty."),
@@ -468,4 +568,11 @@ def render_instructions_page(
     if filename is None:
         filename = build_default_output_file("02_instructions.png")
 
-    return save_page(img, filename, output_width_px=layout.page_width_px, output_height_px=layout.page_height_px, dpi=layout.dpi)
+    return save_page(
+        img,
+        filename,
+        output_width_px=layout.page_width_px,
+        output_height_px=layout.page_height_px,
+        dpi=layout.dpi,
+        resample=FRONT_MATTER_DOWNSCALE,
+    )
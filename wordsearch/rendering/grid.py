@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Sequence
 
 from PIL import Image, ImageDraw
@@ -9,14 +10,13 @@ from PIL import Image, ImageDraw
 from wordsearch.config.design import DEFAULT_THEME, ThemeConfig
 from wordsearch.config.fonts import FONT_PATH, FONT_PATH_BOLD
 from wordsearch.domain.grid import PlacedWord
-from wordsearch.rendering.common import load_font, text_size
+from wordsearch.rendering.common import load_font
 from wordsearch.rendering.highlights import build_solution_highlight_layer
 
 
 def draw_letter_grid(
     *,
     img: Image.Image,
-    draw: ImageDraw.ImageDraw,
     grid: Sequence[Sequence[str]],
     placed_words: Sequence[PlacedWord] | None,
     is_solution: bool,
@@ -27,11 +27,11 @@ def draw_letter_grid(
     highlight_fill: tuple[int, int, int, int],
     highlight_border: tuple[int, int, int, int],
     theme: ThemeConfig = DEFAULT_THEME,
+    highlight_supersample: int = 1,
 ) -> int:
     """Draw the letter grid and return its bottom y coordinate."""
     rows = len(grid)
     cols = len(grid[0]) if rows > 0 else 0
-    grid_w_hi = cell_size_hi * cols
     grid_h_hi = cell_size_hi * rows
     page_w_hi, page_h_hi = img.size
 
@@ -42,83 +42,111 @@ def draw_letter_grid(
     grid_line_width_hi = max(1, int(1.2 * scale))
     grid_line_color = theme.grid_line_color
 
-    highlight_layer = build_solution_highlight_layer(
-        placed_words=placed_words if is_solution else None,
-        rows=rows,
-        cols=cols,
-        grid_left_hi=grid_left_hi,
-        grid_top_hi=grid_top_hi,
-        cell_size_hi=cell_size_hi,
-        page_w_hi=page_w_hi,
-        page_h_hi=page_h_hi,
-        scale=scale,
-        highlight_fill=highlight_fill,
-        highlight_border=highlight_border,
-    )
-
-    for row in range(rows + 1):
-        y = grid_top_hi + row * cell_size_hi
-        draw.line(
-            (grid_left_hi, y, grid_left_hi + grid_w_hi, y),
-            fill=grid_line_color,
-            width=grid_line_width_hi,
-        )
-    for col in range(cols + 1):
-        x = grid_left_hi + col * cell_size_hi
-        draw.line(
-            (x, grid_top_hi, x, grid_top_hi + grid_h_hi),
-            fill=grid_line_color,
-            width=grid_line_width_hi,
+    # Puzzle pages have nothing to highlight: skip the overlay entirely.
+    highlight_layer = None
+    if is_solution and placed_words:
+        highlight_layer = build_solution_highlight_layer(
+            placed_words=placed_words,
+            rows=rows,
+            cols=cols,
+            grid_left_hi=grid_left_hi,
+            grid_top_hi=grid_top_hi,
+            cell_size_hi=cell_size_hi,
+            page_w_hi=page_w_hi,
+            page_h_hi=page_h_hi,
+            scale=scale,
+            highlight_fill=highlight_fill,
+            highlight_border=highlight_border,
+            supersample=highlight_supersample,
         )
 
+    lattice, margin = _grid_lattice_mask(rows, cols, cell_size_hi, grid_line_width_hi)
+    img.paste(grid_line_color, (grid_left_hi - margin, grid_top_hi - margin), lattice)
+
     for row in range(rows):
         for col in range(cols):
-            _draw_centered_letter(
-                draw=draw,
+            _paste_letter(
+                img=img,
                 letter=grid[row][col],
                 font=font_letter,
-                center_x=grid_left_hi + col * cell_size_hi + cell_size_hi / 2,
-                center_y=grid_top_hi + row * cell_size_hi + cell_size_hi / 2,
+                cell_left=grid_left_hi + col * cell_size_hi,
+                cell_top=grid_top_hi + row * cell_size_hi,
+                cell_size=cell_size_hi,
                 fill=theme.letter_color,
             )
 
-    img.alpha_composite(highlight_layer.overlay)
-    if is_solution and highlight_layer.positions:
+    if highlight_layer is not None and highlight_layer.positions:
+        img.alpha_composite(highlight_layer.overlay, dest=highlight_layer.origin)
         for row, col in highlight_layer.positions:
-            _draw_centered_letter(
-                draw=draw,
+            _paste_letter(
+                img=img,
                 letter=grid[row][col],
                 font=font_letter_bold,
-                center_x=grid_left_hi + col * cell_size_hi + cell_size_hi / 2,
-                center_y=grid_top_hi + row * cell_size_hi + cell_size_hi / 2,
+                cell_left=grid_left_hi + col * cell_size_hi,
+                cell_top=grid_top_hi + row * cell_size_hi,
+                cell_size=cell_size_hi,
                 fill=theme.solution_letter_color,
             )
 
     return grid_top_hi + grid_h_hi
 
 
-def _draw_centered_letter(
+@lru_cache(maxsize=16)
+def _grid_lattice_mask(rows: int, cols: int, cell_size: int, line_width: int) -> tuple[Image.Image, int]:
+    """Rasterise all grid lines once into an L mask; return it with its margin.
+
+    The grid geometry only depends on its dimensions, so every page with the
+    same grid shares one mask and the lines cost a single paste.
+    """
+    margin = line_width
+    grid_w = cell_size * cols
+    grid_h = cell_size * rows
+    mask = Image.new("L", (grid_w + 2 * margin + 1, grid_h + 2 * margin + 1), 0)
+    mask_draw = ImageDraw.Draw(mask)
+    for row in range(rows + 1):
+        y = margin + row * cell_size
+        mask_draw.line((margin, y, margin + grid_w, y), fill=255, width=line_width)
+    for col in range(cols + 1):
+        x = margin + col * cell_size
+        mask_draw.line((x, margin, x, margin + grid_h), fill=255, width=line_width)
+    return mask, margin
+
+
+def _paste_letter(
     *,
-    draw: ImageDraw.ImageDraw,
+    img: Image.Image,
     letter: str,
     font,
-    center_x: float,
-    center_y: float,
+    cell_left: int,
+    cell_top: int,
+    cell_size: int,
     fill: tuple[int, int, int, int],
 ) -> None:
-    try:
-        draw.text(
-            (center_x, center_y),
-            letter,
-            fill=fill,
-            font=font,
-            anchor="mm",
-        )
-    except TypeError:
-        letter_w, letter_h = text_size(draw, letter, font)
-        draw.text(
-            (center_x - letter_w / 2, center_y - letter_h / 2),
-            letter,
-            fill=fill,
-            font=font,
-        )
+    glyph = _letter_glyph(letter, font, cell_size)
+    if glyph is None:
+        return
+    mask, offset_x, offset_y = glyph
+    img.paste(fill, (cell_left + offset_x, cell_top + offset_y), mask)
+
+
+@lru_cache(maxsize=256)
+def _letter_glyph(letter: str, font, cell_size: int) -> tuple[Image.Image, int, int] | None:
+    """Rasterise ``letter`` centred in a cell once and return its mask and offset.
+
+    Pasting the ink colour through this mask gives the same pixels as
+    ``draw.text(..., anchor="mm")`` at the cell centre, without shaping the
+    glyph again for every cell of every page.
+    """
+    pad = max(cell_size, int(getattr(font, "size", cell_size)))
+    canvas = Image.new("L", (cell_size + 2 * pad, cell_size + 2 * pad), 0)
+    ImageDraw.Draw(canvas).text(
+        (pad + cell_size / 2, pad + cell_size / 2),
+        letter,
+        fill=255,
+        font=font,
+        anchor="mm",
+    )
+    bbox = canvas.getbbox()
+    if bbox is None:
+        return None
+    return canvas.crop(bbox), bbox[0] - pad, bbox[1] - pad
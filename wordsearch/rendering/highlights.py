@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import List, Sequence, Tuple
 
@@ -12,10 +13,15 @@ from wordsearch.domain.grid import PlacedWord
 
 @dataclass
 class SolutionHighlightLayer:
-    """Transparent highlight overlay plus highlighted grid positions."""
+    """Transparent highlight overlay plus highlighted grid positions.
+
+    ``overlay`` only covers the grid area; ``origin`` is its top-left corner
+    in page coordinates.
+    """
 
     overlay: Image.Image
     positions: set[tuple[int, int]]
+    origin: tuple[int, int] = (0, 0)
 
 
 def build_solution_highlight_layer(
@@ -31,11 +37,32 @@ def build_solution_highlight_layer(
     scale: int,
     highlight_fill,
     highlight_border,
+    supersample: int = 1,
 ) -> SolutionHighlightLayer:
-    """Build solution highlight capsules without applying them to the page."""
+    """Build solution highlight capsules without applying them to the page.
+
+    With ``supersample > 1`` the capsules are drawn at that multiple of the
+    page resolution and downsampled with LANCZOS, which smooths diagonal
+    strokes when the page itself is rendered at 1x.
+    """
     highlight_positions: set[tuple[int, int]] = set()
-    overlay_fill = Image.new("RGBA", (page_w_hi, page_h_hi), (0, 0, 0, 0))
-    overlay_border = Image.new("RGBA", (page_w_hi, page_h_hi), (0, 0, 0, 0))
+
+    # Capsules never reach further than one cell outside the grid.
+    margin = cell_size_hi
+    origin_x = max(0, grid_left_hi - margin)
+    origin_y = max(0, grid_top_hi - margin)
+    overlay_size = (
+        min(page_w_hi, grid_left_hi + cols * cell_size_hi + margin) - origin_x,
+        min(page_h_hi, grid_top_hi + rows * cell_size_hi + margin) - origin_y,
+    )
+    grid_left = (grid_left_hi - origin_x) * supersample
+    grid_top = (grid_top_hi - origin_y) * supersample
+    cell_size = cell_size_hi * supersample
+    draw_scale = scale * supersample
+    canvas_size = (overlay_size[0] * supersample, overlay_size[1] * supersample)
+
+    overlay_fill = Image.new("RGBA", canvas_size, (0, 0, 0, 0))
+    overlay_border = Image.new("RGBA", canvas_size, (0, 0, 0, 0))
     odraw_fill = ImageDraw.Draw(overlay_fill)
 
     if placed_words:
@@ -45,26 +72,21 @@ def build_solution_highlight_layer(
             if word_len < 2:
                 continue
 
-            centers: List[Tuple[float, float]] = []
-            for i in range(word_len):
-                rr = row + d_row * i
-                cc = col + d_col * i
-                if rr < 0 or rr >= rows or cc < 0 or cc >= cols:
-                    break
-
-                x0 = grid_left_hi + cc * cell_size_hi
-                y0 = grid_top_hi + rr * cell_size_hi
-                cx = x0 + cell_size_hi / 2
-                cy = y0 + cell_size_hi / 2
-                centers.append((cx, cy))
-                highlight_positions.add((rr, cc))
-
-            if len(centers) < 2:
+            length = _in_bounds_length(row, col, d_row, d_col, word_len, rows, cols)
+            cells = [(row + d_row * i, col + d_col * i) for i in range(length)]
+            highlight_positions.update(cells)
+            if length < 2:
                 continue
 
+            half_cell = cell_size / 2
+            centers: List[Tuple[float, float]] = [
+                (grid_left + cc * cell_size + half_cell, grid_top + rr * cell_size + half_cell)
+                for rr, cc in cells
+            ]
+
             p0 = centers[0]
             p1 = centers[-1]
-            thickness = cell_size_hi * 0.67
+            thickness = cell_size * 0.67
             radius = thickness / 2
 
             odraw_fill.line(
@@ -79,14 +101,23 @@ def build_solution_highlight_layer(
                     fill=highlight_fill,
                 )
 
-            tmp_border = Image.new("RGBA", (page_w_hi, page_h_hi), (0, 0, 0, 0))
-            bdraw = ImageDraw.Draw(tmp_border)
-
-            outer_width = int(thickness + 8 * scale)
+            outer_width = int(thickness + 8 * draw_scale)
             inner_width = int(thickness)
-            outer_radius = radius + 4 * scale
+            outer_radius = radius + 4 * draw_scale
             inner_radius = radius
 
+            # The ring is drawn on a scratch layer clipped to this word's capsule
+            # and shifted by whole pixels, so rasterisation is unchanged.
+            box_left = max(0, math.floor(min(p0[0], p1[0]) - outer_radius) - 2)
+            box_top = max(0, math.floor(min(p0[1], p1[1]) - outer_radius) - 2)
+            box_right = min(canvas_size[0], math.ceil(max(p0[0], p1[0]) + outer_radius) + 3)
+            box_bottom = min(canvas_size[1], math.ceil(max(p0[1], p1[1]) + outer_radius) + 3)
+            tmp_border = Image.new("RGBA", (box_right - box_left, box_bottom - box_top), (0, 0, 0, 0))
+            bdraw = ImageDraw.Draw(tmp_border)
+            centers = [(cx - box_left, cy - box_top) for cx, cy in centers]
+            p0 = centers[0]
+            p1 = centers[-1]
+
             bdraw.line(
                 centers,
                 fill=highlight_border,
@@ -122,13 +153,29 @@ def build_solution_highlight_layer(
                     fill=transparent,
                 )
 
-            overlay_border.alpha_composite(tmp_border)
+            overlay_border.alpha_composite(tmp_border, dest=(box_left, box_top))
 
-    overlay = Image.new("RGBA", (page_w_hi, page_h_hi), (0, 0, 0, 0))
+    overlay = Image.new("RGBA", canvas_size, (0, 0, 0, 0))
     overlay.alpha_composite(overlay_fill)
     overlay.alpha_composite(overlay_border)
+    if supersample > 1:
+        overlay = overlay.resize(overlay_size, Image.Resampling.LANCZOS)
 
     return SolutionHighlightLayer(
         overlay=overlay,
         positions=highlight_positions,
+        origin=(origin_x, origin_y),
     )
+
+
+def _in_bounds_length(row: int, col: int, d_row: int, d_col: int, word_len: int, rows: int, cols: int) -> int:
+    """Return how many leading letters of a placed word fall inside the grid."""
+    length = word_len
+    for start, delta, limit in ((row, d_row, rows), (col, d_col, cols)):
+        if not 0 <= start < limit:
+            return 0
+        if delta > 0:
+            length = min(length, (limit - 1 - start) // delta + 1)
+        elif delta < 0:
+            length = min(length, start // -delta + 1)
+    return length
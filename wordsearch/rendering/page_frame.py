@@ -4,13 +4,18 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 from PIL import Image, ImageDraw, ImageFont
 
 from wordsearch.config.design import DEFAULT_LAYOUT, DEFAULT_THEME, LayoutConfig, ThemeConfig
-from wordsearch.rendering.backgrounds import BACKGROUND_PATH
+from wordsearch.rendering.backgrounds import BACKGROUND_PATH, load_page_background
 from wordsearch.rendering.common import rounded_rectangle, text_size, wrap_text
 
+# Backgrounds are decorative photos dimmed behind the panel; BILINEAR is much
+# cheaper than LANCZOS and indistinguishable at print resolution.
+PAGE_BACKGROUND_RESAMPLE = Image.Resampling.BILINEAR
+
 
 @dataclass(frozen=True)
 class PageFrame:
@@ -33,24 +38,30 @@ def create_page_canvas(
     *,
     theme: ThemeConfig = DEFAULT_THEME,
     layout: LayoutConfig = DEFAULT_LAYOUT,
+    mode: str = "RGBA",
 ) -> Image.Image:
-    """Create a high-resolution page canvas with optional translucent background."""
+    """Create a high-resolution page canvas with optional translucent background.
+
+    ``mode="RGB"`` drops the alpha channel up front, which is what
+    ``save_page`` does anyway; use it for pages that never alpha-composite.
+    Only the 1x background repeats across pages, so supersampled canvases
+    skip the background cache.
+    """
     page_w_hi = layout.page_width_px * scale
     page_h_hi = layout.page_height_px * scale
-    bg_path = background_path or BACKGROUND_PATH
-
-    if bg_path and os.path.exists(bg_path):
-        bg = Image.open(bg_path).convert("RGBA")
-        bg = bg.resize((page_w_hi, page_h_hi), Image.LANCZOS)
-
-        if bg.mode == "RGBA":
-            red, green, blue, alpha = bg.split()
-            alpha = alpha.point(lambda value: int(value * theme.background_opacity))
-            bg = Image.merge("RGBA", (red, green, blue, alpha))
-
+    bg = load_page_background(
+        background_path or BACKGROUND_PATH,
+        (page_w_hi, page_h_hi),
+        theme.background_opacity,
+        resample=PAGE_BACKGROUND_RESAMPLE,
+        mode=mode,
+        cached=scale == 1,
+    )
+    if bg is not None:
         return bg
 
-    return Image.new("RGBA", (page_w_hi, page_h_hi), theme.page_background_fill)
+    bg = Image.new("RGBA", (page_w_hi, page_h_hi), theme.page_background_fill)
+    return bg if mode == "RGBA" else bg.convert(mode)
 
 
 def draw_page_frame(
@@ -105,6 +116,41 @@ def draw_page_frame(
     )
 
 
+def create_framed_page(
+    background_path: str | None,
+    scale: int,
+    *,
+    theme: ThemeConfig = DEFAULT_THEME,
+    layout: LayoutConfig = DEFAULT_LAYOUT,
+    mode: str = "RGBA",
+) -> tuple[Image.Image, PageFrame]:
+    """Return a private page canvas with the content panel already drawn.
+
+    Every puzzle and solution page starts from the same background and panel,
+    so they are composed once per background, scale, theme, layout and mode
+    and each page only pays for a copy.
+    """
+    path = background_path or BACKGROUND_PATH
+    mtime_ns = os.stat(path).st_mtime_ns if os.path.exists(path) else None
+    template, frame = _framed_page_template(path, mtime_ns, scale, theme, layout, mode)
+    return template.copy(), frame
+
+
+@lru_cache(maxsize=4)
+def _framed_page_template(
+    background_path: str,
+    mtime_ns: int | None,
+    scale: int,
+    theme: ThemeConfig,
+    layout: LayoutConfig,
+    mode: str,
+) -> tuple[Image.Image, PageFrame]:
+    """Build the shared canvas + panel; keyed by mtime so edited backgrounds reload."""
+    img = create_page_canvas(background_path, scale, theme=theme, layout=layout, mode=mode)
+    frame = draw_page_frame(draw=ImageDraw.Draw(img), scale=scale, theme=theme, layout=layout)
+    return img, frame
+
+
 def draw_wrapped_centered_title(
     draw: ImageDraw.ImageDraw,
     text: str,
@@ -1,9 +1,12 @@
 """PDF assembly from rendered puzzle and solution page images."""
 
+import io
 from pathlib import Path
 from typing import Mapping
 
+from PIL import Image
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
 from wordsearch.config.design import DEFAULT_LAYOUT, LayoutConfig
@@ -12,6 +15,10 @@ from wordsearch.rendering.backgrounds import BACKGROUND_PATH
 
 PdfMetadata = Mapping[str, str | None]
 
+PAGE_NUMBER_FONT = "Helvetica"
+PAGE_NUMBER_FONT_SIZE = 10
+PAGE_NUMBER_Y = 0.35 * inch
+
 
 def _apply_pdf_metadata(c: canvas.Canvas, metadata: PdfMetadata | None) -> None:
     """Apply basic document metadata when provided."""
@@ -36,6 +43,32 @@ def _apply_pdf_metadata(c: canvas.Canvas, metadata: PdfMetadata | None) -> None:
         c.setCreator(creator)
 
 
+def _page_image(img: str, jpeg_quality: int | None) -> str | ImageReader:
+    """Devuelve la imagen a incrustar; en JPEG si se pide calidad.
+
+    reportlab copia un JPEG tal cual al PDF (DCTDecode) en vez de
+    recomprimir los píxeles del PNG con Flate, lo que reduce mucho el
+    tamaño del fichero y el tiempo de ``save``. Sin calidad se mantiene
+    el PNG sin pérdidas.
+    """
+    if jpeg_quality is None:
+        return img
+
+    buffer = io.BytesIO()
+    with Image.open(img) as page:
+        page.convert("RGB").save(buffer, format="JPEG", quality=jpeg_quality, subsampling=0)
+    buffer.seek(0)
+    return ImageReader(buffer)
+
+
+def _emit_page(c: canvas.Canvas, image, page_num: int, width: float, height: float) -> None:
+    """Dibuja una página de imagen a sangre con su número y la cierra."""
+    c.drawImage(image, 0, 0, width=width, height=height)
+    c.setFont(PAGE_NUMBER_FONT, PAGE_NUMBER_FONT_SIZE)
+    c.drawCentredString(width / 2, PAGE_NUMBER_Y, str(page_num))
+    c.showPage()
+
+
 def generate_pdf(
     puzzle_imgs,
     solution_imgs,
@@ -43,38 +76,37 @@ def generate_pdf(
     background_path=None,
     metadata: PdfMetadata | None = None,
     layout: LayoutConfig = DEFAULT_LAYOUT,
+    jpeg_quality: int | None = None,
 ):
     pdf_path = resolve_pdf_output_path(outname)
-    c = canvas.Canvas(pdf_path, pagesize=(layout.trim_width_in * inch, layout.trim_height_in * inch))
+    width = layout.trim_width_in * inch
+    height = layout.trim_height_in * inch
+    # showPage() resets the fill colour to black, so it never needs to be
+    # set again. The font is reset to reportlab's 12pt preamble default,
+    # which is why _emit_page still selects the page-number font per page.
+    # Page compression is requested explicitly rather than inherited from
+    # the installed reportlab's rl_config default.
+    c = canvas.Canvas(pdf_path, pagesize=(width, height), pageCompression=1)
     _apply_pdf_metadata(c, metadata)
 
     page_num = 1
     for img in puzzle_imgs:
-        c.drawImage(img, 0, 0, width=layout.trim_width_in * inch, height=layout.trim_height_in * inch)
-        c.setFont("Helvetica", 10)
-        c.setFillColorRGB(0, 0, 0)
-        c.drawCentredString(layout.trim_width_in * inch / 2, 0.35 * inch, str(page_num))
-        c.showPage()
+        _emit_page(c, _page_image(img, jpeg_quality), page_num, width, height)
         page_num += 1
 
     bg_path = background_path or BACKGROUND_PATH
     if bg_path and Path(bg_path).exists():
-        c.drawImage(bg_path, 0, 0, width=layout.trim_width_in * inch, height=layout.trim_height_in * inch, mask="auto")
+        c.drawImage(bg_path, 0, 0, width=width, height=height, mask="auto")
 
     c.setFont("Helvetica-Bold", 36)
-    c.setFillColorRGB(0, 0, 0)
-    c.drawCentredString(layout.trim_width_in * inch / 2, layout.trim_height_in * inch / 2, "SOLUTIONS")
-    c.setFont("Helvetica", 10)
-    c.drawCentredString(layout.trim_width_in * inch / 2, 0.35 * inch, str(page_num))
+    c.drawCentredString(width / 2, height / 2, "SOLUTIONS")
+    c.setFont(PAGE_NUMBER_FONT, PAGE_NUMBER_FONT_SIZE)
+    c.drawCentredString(width / 2, PAGE_NUMBER_Y, str(page_num))
     c.showPage()
     page_num += 1
 
     for img in solution_imgs:
-        c.drawImage(img, 0, 0, width=layout.trim_width_in * inch, height=layout.trim_height_in * inch)
-        c.setFont("Helvetica", 10)
-        c.setFillColorRGB(0, 0, 0)
-        c.drawCentredString(layout.trim_width_in * inch / 2, 0.35 * inch, str(page_num))
-        c.showPage()
+        _emit_page(c, _page_image(img, jpeg_quality), page_num, width, height)
         page_num += 1
 
     c.save()
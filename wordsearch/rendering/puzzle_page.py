@@ -10,26 +10,21 @@ from wordsearch.config.design import DEFAULT_LAYOUT, DEFAULT_THEME, LayoutConfig
 from wordsearch.config.fonts import FONT_PATH, FONT_PATH_BOLD, wordlist_font_size as WORDLIST_FONT_SIZE
 from wordsearch.config.paths import build_default_output_file
 from wordsearch.rendering.adaptive_layout import plan_fact_layout, plan_title_layout
-from wordsearch.rendering.common import load_font, rounded_rectangle, save_page, text_size
+from wordsearch.rendering.common import (
+    draw_centered_text_in_box,
+    format_visual_scale,
+    load_font,
+    rounded_rectangle,
+    save_page,
+    text_size,
+)
 from wordsearch.rendering.grid import draw_letter_grid
-from wordsearch.rendering.page_frame import create_page_canvas, draw_page_frame
+from wordsearch.rendering.page_frame import create_framed_page
 from wordsearch.rendering.word_list import draw_word_list
 
-
-def _format_visual_scale(layout: LayoutConfig = DEFAULT_LAYOUT) -> float:
-    width_scale = layout.page_width_px / DEFAULT_LAYOUT.page_width_px
-    height_scale = layout.page_height_px / DEFAULT_LAYOUT.page_height_px
-    return min(1.15, max(1.0, min(width_scale, height_scale)))
-
-
-def _draw_centered_text_in_box(draw: ImageDraw.ImageDraw, text: str, font, *, center_x: float, center_y: float, fill) -> None:
-    try:
-        draw.text((center_x, center_y), text, font=font, fill=fill, anchor="mm")
-    except TypeError:
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_w = bbox[2] - bbox[0]
-        text_h = bbox[3] - bbox[1]
-        draw.text((center_x - text_w / 2 - bbox[0], center_y - text_h / 2 - bbox[1]), text, font=font, fill=fill)
+# Puzzle pages are drawn directly at the output DPI: FreeType already anti-aliases the
+# text, and skipping the supersample avoids a 9x larger canvas plus a full-page resample.
+PUZZLE_RENDER_SCALE = 1
 
 
 def _draw_title_separator(
@@ -155,7 +150,7 @@ def _draw_fun_fact_label(
         outline=None,
         width=0,
     )
-    _draw_centered_text_in_box(
+    draw_centered_text_in_box(
         draw,
         fact_label,
         label_font,
@@ -177,13 +172,12 @@ def render_page(
     solution_page_number: Optional[int] = None,
     theme: ThemeConfig = DEFAULT_THEME,
     layout: LayoutConfig = DEFAULT_LAYOUT,
+    scale: int = PUZZLE_RENDER_SCALE,
 ) -> str:
-    """Renderiza una página de puzzle."""
-    scale = 3
-    visual_scale = _format_visual_scale(layout)
-    img = create_page_canvas(background_path, scale, theme=theme, layout=layout)
+    """Renderiza una página de puzzle a ``scale`` veces la resolución final."""
+    visual_scale = format_visual_scale(layout)
+    img, frame = create_framed_page(background_path, scale, theme=theme, layout=layout, mode="RGB")
     draw = ImageDraw.Draw(img)
-    frame = draw_page_frame(draw=draw, scale=scale, theme=theme, layout=layout)
 
     safe_bottom_hi = frame.safe_bottom_hi
     panel_top = frame.panel_top
@@ -286,7 +280,6 @@ def render_page(
 
     grid_bottom_hi = draw_letter_grid(
         img=img,
-        draw=draw,
         grid=grid,
         placed_words=None,
         is_solution=False,
@@ -329,10 +322,7 @@ def render_page(
         )
         tx = pill_x + box_w / 2
         ty = pill_y + box_h / 2
-        try:
-            draw.text((tx, ty), pill_text, font=pill_font, fill=theme.pill_text, anchor="mm")
-        except TypeError:
-            draw.text((tx - tw_pill / 2, ty - th_pill / 2), pill_text, font=pill_font, fill=theme.pill_text)
+        draw.text((tx, ty), pill_text, font=pill_font, fill=theme.pill_text, anchor="mm")
 
     desired_words_top_hi = pill_y + pill_box_h + gap_pill_to_words_hi
     if desired_words_top_hi > words_top_hi:
@@ -0,0 +1,128 @@
+"""Content-addressed reuse of rendered page PNGs across runs."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import time
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+
+import PIL
+
+from wordsearch.config import fonts
+from wordsearch.config.paths import BASE_OUTPUT_DIR
+from wordsearch.rendering.backgrounds import BACKGROUND_PATH
+
+RENDER_CACHE_DIR = str(Path(BASE_OUTPUT_DIR) / ".render_cache")
+
+# Bump to invalidate every cached page when pixels change for a reason the
+# source fingerprint below cannot see.
+RENDER_CACHE_VERSION = 1
+
+# Cached pages that have not been reused for this long are dropped by prune_render_cache().
+RENDER_CACHE_MAX_AGE_DAYS = 30
+
+
+@lru_cache(maxsize=1)
+def _renderer_fingerprint() -> str:
+    """Hash the modules that decide page pixels, so any code edit misses the cache."""
+    package_root = Path(__file__).resolve().parent.parent
+    digest = hashlib.blake2b(digest_size=16)
+    for folder in ("rendering", "config"):
+        for source in sorted((package_root / folder).glob("*.py")):
+            digest.update(source.name.encode())
+            digest.update(source.read_bytes())
+    digest.update(PIL.__version__.encode())
+    return digest.hexdigest()
+
+
+def _generation_dir(cache_dir: str) -> Path:
+    """Return the subfolder for pages rendered by the current renderer code and Pillow version."""
+    return Path(cache_dir) / f"v{RENDER_CACHE_VERSION}-{_renderer_fingerprint()}"
+
+
+def _file_stamp(path: str | None) -> tuple:
+    if path and os.path.exists(path):
+        stat = os.stat(path)
+        return (path, stat.st_size, stat.st_mtime_ns)
+    return (path,)
+
+
+def render_cache_key(render: Callable[..., str], args: tuple, kwargs: dict) -> str:
+    """Return the cache key for one page render, ignoring where it is written."""
+    page_kwargs = sorted((name, value) for name, value in kwargs.items() if name != "filename")
+    assets = [
+        _file_stamp(kwargs.get("background_path") or BACKGROUND_PATH),
+        _file_stamp(fonts.FONT_PATH),
+        _file_stamp(fonts.FONT_PATH_BOLD),
+        _file_stamp(fonts.FONT_TITLE),
+    ]
+    payload = repr(
+        (
+            RENDER_CACHE_VERSION,
+            _renderer_fingerprint(),
+            render.__module__,
+            render.__qualname__,
+            args,
+            page_kwargs,
+            assets,
+        )
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def render_cached(render: Callable[..., str], *args, cache_dir: str = RENDER_CACHE_DIR, **kwargs) -> str:
+    """Call ``render(*args, **kwargs)`` unless an identical page is already cached.
+
+    On a hit the cached PNG is copied to ``filename``; on a miss the page is
+    rendered and a copy is stored under its content hash.
+    """
+    filename = kwargs["filename"]
+    cached = _generation_dir(cache_dir) / f"{render_cache_key(render, args, kwargs)}.png"
+    if cached.exists():
+        shutil.copyfile(cached, filename)
+        # Refresh the mtime so pruning measures age from the last reuse.
+        os.utime(cached)
+        return filename
+
+    rendered = render(*args, **kwargs)
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    partial = cached.with_name(f"{cached.stem}.{os.getpid()}.tmp")
+    shutil.copyfile(rendered, partial)
+    os.replace(partial, cached)
+    return rendered
+
+
+def prune_render_cache(cache_dir: str = RENDER_CACHE_DIR, *, max_age_days: float = RENDER_CACHE_MAX_AGE_DAYS) -> int:
+    """Drop cached pages that can no longer be hit or have gone unused; return how many files were removed.
+
+    Everything outside the current generation folder was rendered by other
+    renderer code or another Pillow version and is removed outright. Inside it, pages not reused
+    within ``max_age_days`` and leftover temporary files are removed too.
+    """
+    root = Path(cache_dir)
+    if not root.is_dir():
+        return 0
+
+    current = _generation_dir(cache_dir)
+    removed = 0
+    for entry in root.iterdir():
+        if entry == current:
+            continue
+        if entry.is_dir():
+            removed += sum(1 for path in entry.rglob("*") if path.is_file())
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
+            removed += 1
+
+    if current.is_dir():
+        cutoff = time.time() - max_age_days * 86400
+        for entry in current.iterdir():
+            if entry.suffix == ".tmp" or entry.stat().st_mtime < cutoff:
+                entry.unlink(missing_ok=True)
+                removed += 1
+    return removed
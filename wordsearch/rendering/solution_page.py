@@ -12,9 +12,15 @@ from wordsearch.config.paths import build_default_output_file
 from wordsearch.domain.grid import PlacedWord
 from wordsearch.rendering.common import load_font, save_page
 from wordsearch.rendering.grid import draw_letter_grid
-from wordsearch.rendering.page_frame import create_page_canvas, draw_page_frame, draw_wrapped_centered_title
+from wordsearch.rendering.page_frame import create_framed_page, draw_wrapped_centered_title
 from wordsearch.rendering.word_list import draw_word_list
 
+# Like puzzle pages, solutions are drawn at the output DPI. Only the translucent
+# highlight capsules are supersampled, in a grid-sized layer, to keep their
+# diagonal edges smooth.
+SOLUTION_RENDER_SCALE = 1
+SOLUTION_HIGHLIGHT_SUPERSAMPLE = 2
+
 
 def render_solution_page(
     grid: Sequence[Sequence[str]],
@@ -27,12 +33,11 @@ def render_solution_page(
     puzzle_title: Optional[str] = None,
     theme: ThemeConfig = DEFAULT_THEME,
     layout: LayoutConfig = DEFAULT_LAYOUT,
+    scale: int = SOLUTION_RENDER_SCALE,
 ) -> str:
     """Render a solution page with highlighted placed words."""
-    scale = 3
-    img = create_page_canvas(background_path, scale, theme=theme, layout=layout)
+    img, frame = create_framed_page(background_path, scale, theme=theme, layout=layout)
     draw = ImageDraw.Draw(img)
-    frame = draw_page_frame(draw=draw, scale=scale, theme=theme, layout=layout)
 
     safe_bottom_hi = frame.safe_bottom_hi
     content_left_hi = frame.content_left_hi
@@ -63,7 +68,6 @@ def render_solution_page(
 
     grid_bottom_hi = draw_letter_grid(
         img=img,
-        draw=draw,
         grid=grid,
         placed_words=placed_words,
         is_solution=True,
@@ -74,6 +78,7 @@ def render_solution_page(
         highlight_fill=theme.highlight_fill,
         highlight_border=theme.highlight_border,
         theme=theme,
+        highlight_supersample=SOLUTION_HIGHLIGHT_SUPERSAMPLE if scale == 1 else 1,
     )
 
     words_bottom_hi = safe_bottom_hi - int(8 * scale)
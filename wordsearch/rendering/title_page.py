@@ -77,7 +77,7 @@ def render_title_page(
     width_hi = layout.page_width_px * scale
     height_hi = layout.page_height_px * scale
 
-    img = create_page_canvas(background_path, scale, theme=theme, layout=layout)
+    img = create_page_canvas(background_path, scale, theme=theme, layout=layout, mode="RGB")
     draw = ImageDraw.Draw(img)
     _draw_soft_panel(draw, scale, theme=theme, layout=layout)
 
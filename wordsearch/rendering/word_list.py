@@ -7,7 +7,6 @@ from typing import Iterable, List
 from PIL import ImageDraw
 
 from wordsearch.rendering.adaptive_layout import plan_word_list_layout
-from wordsearch.rendering.common import text_size
 
 
 def draw_word_list(
@@ -51,28 +50,23 @@ def draw_word_list(
     max_used_h = max(len(col) * plan.line_height_hi for col in col_words) if col_words else 0
     group_y_start = words_top_hi + (plan.words_height_hi - max_used_h) // 2
 
+    # One multiline call per column: Pillow spaces lines by the height of "A"
+    # plus ``spacing`` and keeps anchor="mm" per line, so each word lands on
+    # the same centre as an individual draw.text call.
+    spacing = plan.line_height_hi - plan.font.getbbox("A")[3]
+
     for col_idx, col in enumerate(col_words):
         if not col:
             continue
 
         col_center_x = int(plan.area_left_hi + (col_idx + 0.5) * plan.col_width_hi)
-        y_hi = int(group_y_start)
-
-        for word_text in col:
-            try:
-                draw.text(
-                    (col_center_x, y_hi),
-                    word_text,
-                    fill=text_color,
-                    font=plan.font,
-                    anchor="mm",
-                )
-            except TypeError:
-                word_w, word_h = text_size(draw, word_text, plan.font)
-                draw.text(
-                    (col_center_x - word_w / 2, y_hi - word_h / 2),
-                    word_text,
-                    fill=text_color,
-                    font=plan.font,
-                )
-            y_hi += plan.line_height_hi
+        col_middle_y = int(group_y_start) + (len(col) - 1) * plan.line_height_hi / 2
+        draw.multiline_text(
+            (col_center_x, col_middle_y),
+            "\n".join(col),
+            fill=text_color,
+            font=plan.font,
+            anchor="mm",
+            spacing=spacing,
+            align="center",
+        )
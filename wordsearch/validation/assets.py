@@ -77,18 +77,7 @@ class AssetValidationReport:
 
 def collect_background_paths(backgrounds: Iterable[str | None]) -> list[str]:
     """Return unique non-empty background paths preserving input order."""
-    unique_paths: list[str] = []
-    seen: set[str] = set()
-
-    for background in backgrounds:
-        if not background:
-            continue
-        if background in seen:
-            continue
-        seen.add(background)
-        unique_paths.append(background)
-
-    return unique_paths
+    return list(dict.fromkeys(background for background in backgrounds if background))
 
 
 def validate_generation_assets(
@@ -20,7 +20,7 @@ from wordsearch.config.fonts import (
     title_font_size as TITLE_FONT_SIZE,
     wordlist_font_size as WORDLIST_FONT_SIZE,
 )
-from wordsearch.config.layout import PAGE_H_PX, PAGE_W_PX
+from wordsearch.config.layout import PAGE_W_PX
 from wordsearch.domain.generated_puzzle import GeneratedPuzzle
 from wordsearch.domain.page_plan import PagePlan
 from wordsearch.rendering.adaptive_layout import (
@@ -30,6 +30,7 @@ from wordsearch.rendering.adaptive_layout import (
 )
 from wordsearch.rendering.common import load_font, text_size, wrap_text
 from wordsearch.rendering.page_frame import draw_page_frame
+from wordsearch.rendering.puzzle_page import PUZZLE_RENDER_SCALE
 
 RENDER_QUALITY_SCHEMA_VERSION = 1
 WORD_LIST_OVERFLOW_RATIO = 1.08
@@ -122,7 +123,8 @@ def build_render_quality_report(
 
 
 def _make_measure_draw(theme: ThemeConfig) -> ImageDraw.ImageDraw:
-    image = Image.new("RGBA", (PAGE_W_PX * 3, PAGE_H_PX * 3), theme.page_background_fill)
+    """Shared measuring draw; textbbox ignores canvas size, so 1x1 avoids filling a 3x page."""
+    image = Image.new("RGBA", (1, 1), theme.page_background_fill)
     return ImageDraw.Draw(image)
 
 
@@ -229,13 +231,8 @@ def _analyze_block_covers(
     base_size = int(TITLE_FONT_SIZE * 1.6) * scale
     min_size = int(TITLE_FONT_SIZE * 1.0) * scale
 
-    block_names = []
-    seen = set()
-    for generated in generated_puzzles:
-        block_name = (generated.spec.block_name or "").strip()
-        if block_name and block_name not in seen:
-            seen.add(block_name)
-            block_names.append(block_name)
+    stripped_names = ((generated.spec.block_name or "").strip() for generated in generated_puzzles)
+    block_names = list(dict.fromkeys(name for name in stripped_names if name))
 
     for block_index, block_name in enumerate(block_names, start=1):
         font_size = base_size
@@ -343,7 +340,7 @@ def _measure_puzzle_layout(
     draw: ImageDraw.ImageDraw,
     theme: ThemeConfig,
 ) -> dict[str, Any]:
-    scale = 3
+    scale = PUZZLE_RENDER_SCALE
     frame = draw_page_frame(draw=draw, scale=scale, theme=theme)
     spec = generated.spec
     title_text = f"{spec.index + 1}. {spec.title}" if spec.title else f"Puzzle {spec.index + 1}"
@@ -19,7 +19,9 @@ def validate_wordlists_for_grid(
 
     for list_index, wordlist in enumerate(wordlists):
         for word in wordlist:
-            if not word:
+            # Stripping only ever shortens a word, so anything that already
+            # fits needs no cleaning. Only candidate violations pay for it.
+            if not word or len(word) <= grid_size:
                 continue
             clean_word = word.strip()
             if remove_spaces: